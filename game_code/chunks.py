@@ -0,0 +1,373 @@
+# Copyright (c) 2025 Your Name
+# Licensed under the AGPLv3 License. See LICENSE file for details.
+#
+# This project is based on a tutorial (link: https://www.youtube.com/watch?v=T4IX36sP_0c).
+# You can redistribute and/or modify it under the terms of the AGPLv3.
+#
+# This software comes with no warranty. See the LICENSE file for more information.
+
+import json
+from collections import OrderedDict
+from os import path
+from typing import Callable
+
+import pygame
+from game_code.settings import *
+from game_code.sprites import Generic
+from game_code.support import asset_lock
+
+
+def layer_tiles(tmx_data, layer_names: list[str]) -> list:
+    """
+    :param tmx_data: loaded map
+    :param layer_names: tile layers to read, in drawing order
+    :return: list of (rect, surface) for every tile of the layers
+    """
+    tiles = []
+    for layer in layer_names:
+        for x, y, surf in tmx_data.get_layer_by_name(layer).tiles():
+            tiles.append((surf.get_rect(topleft=(x * TILE_SIZE,
+                                                 y * TILE_SIZE)), surf))
+    return tiles
+
+
+def bake_surface(tiles: list, area: pygame.Rect) -> pygame.Surface:
+    """
+    Draws tiles on a transparent surface covering area, in the order the
+    camera would have drawn them as separate sprites.
+    :param tiles: list of (rect, surface)
+    :param area: part of the world covered by the surface
+    :return: the baked surface
+    """
+    surf = pygame.Surface(area.size, pygame.SRCALPHA)
+    ordered = sorted(enumerate(tiles),
+                     key=lambda item: (item[1][0].centery, item[0]))
+    for _, (rect, tile_surf) in ordered:
+        surf.blit(tile_surf, rect.move(-area.x, -area.y))
+    return surf
+
+
+def bake_tile_layers(tmx_data, layer_names: list[str], groups, z: int,
+                     y_sorted: bool = False):
+    """
+    Bakes static tile layers into a few big sprites at map load, so a screen
+    of scenery costs a handful of blits instead of one per tile.
+
+    Flat layers are cut into STATIC_CHUNK_SIZE squares. Layers which have to
+    interleave with the player (z 'main') are cut into one strip per tile row
+    and chunk column instead: every tile of a strip shares its centery, so the
+    strip sorts exactly like the tiles it replaces.
+    :param tmx_data: loaded map
+    :param layer_names: tile layers to bake, in drawing order
+    :param groups: groups the baked sprites are added to
+    :param z: layer of the baked sprites
+    :param y_sorted: True if the tiles are y sorted with other sprites
+    :return: None
+    """
+    size = STATIC_CHUNK_SIZE
+    chunks = {}
+    for rect, surf in layer_tiles(tmx_data, layer_names):
+        if y_sorted:
+            chunks.setdefault((rect.left // size, rect.centery), []).append(
+                (rect, surf))
+        else:
+            for col in range(rect.left // size, (rect.right - 1) // size + 1):
+                for row in range(rect.top // size,
+                                 (rect.bottom - 1) // size + 1):
+                    chunks.setdefault((col, row), []).append((rect, surf))
+
+    for (col, row), tiles in chunks.items():
+        area = tiles[0][0].unionall([rect for rect, _ in tiles])
+        if not y_sorted:
+            area = area.clip(pygame.Rect(col * size, row * size, size, size))
+        Generic(area.topleft, bake_surface(tiles, area), groups, z)
+
+
+class SurfaceLRU:
+    """
+    Least recently used cache of surfaces, bounded by the memory the pixels
+    take rather than by a number of entries.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.surfaces = OrderedDict()
+
+    def get(self, key, load: Callable) -> pygame.Surface:
+        """
+        :param key: hashable key of the surface
+        :param load: called to create the surface when it is not cached
+        :return: the cached or newly loaded surface
+        """
+        surf = self.surfaces.get(key)
+        if surf is not None:
+            self.surfaces.move_to_end(key)
+            return surf
+
+        surf = load()
+        self.surfaces[key] = surf
+        self.bytes += surf.get_pitch() * surf.get_height()
+        # always keep the surface that was just asked for
+        while self.bytes > self.max_bytes and len(self.surfaces) > 1:
+            _, old = self.surfaces.popitem(last=False)
+            self.bytes -= old.get_pitch() * old.get_height()
+        return surf
+
+
+# shared by every map, so the budget holds across map swaps
+ground_cache = SurfaceLRU(GROUND_CACHE_BYTES)
+
+
+class GroundTiles:
+    """
+    Serves a big world image (e.g. 'ground 2.png') as GROUND_TILE_SIZE tiles.
+    The image is decoded once, the first time it is used, and split into tile
+    files under data/cache. From then on a tile is only decoded when the camera
+    first draws it, and kept in the ground_cache LRU.
+    """
+
+    def __init__(self, image_path: str):
+        self.image_path = image_path
+        name = path.splitext(path.basename(image_path))[0]
+        self.tile_dir = path.join(CURR_PATH, 'data', 'cache', 'ground', name)
+        self.manifest = self.load_manifest()
+        # surfaces of the source image, only used if the cache is not writable
+        self.fallback = None
+        # (col, row) -> tile decoded ahead of time but not converted yet
+        self.decoded = {}
+        if self.manifest is None:
+            self.manifest = self.split()
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return self.manifest["width"], self.manifest["height"]
+
+    def source_stamp(self) -> list[int]:
+        stat = os.stat(self.image_path)
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def load_manifest(self):
+        """
+        :return: manifest of the tile cache, None if missing or out of date
+        """
+        try:
+            with open(path.join(self.tile_dir, 'manifest.json'), 'r') as f:
+                manifest = json.loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+        if manifest.get("source") != self.source_stamp() or \
+                manifest.get("tile_size") != GROUND_TILE_SIZE:
+            return None
+        return manifest
+
+    def split(self) -> dict:
+        """
+        Decodes the source image and writes its non-empty tiles to the cache
+        :return: the new manifest
+        """
+        source = pygame.image.load(self.image_path)
+        width, height = source.get_size()
+        manifest = {"source": self.source_stamp(),
+                    "tile_size": GROUND_TILE_SIZE,
+                    "width": width, "height": height, "tiles": []}
+        tiles = {}
+        for top in range(0, height, GROUND_TILE_SIZE):
+            for left in range(0, width, GROUND_TILE_SIZE):
+                rect = pygame.Rect(left, top, GROUND_TILE_SIZE,
+                                   GROUND_TILE_SIZE).clip(source.get_rect())
+                tile = source.subsurface(rect)
+                # fully transparent tiles (e.g. under the water) are skipped
+                if pygame.mask.from_surface(tile).count() == 0:
+                    continue
+                key = (left // GROUND_TILE_SIZE, top // GROUND_TILE_SIZE)
+                manifest["tiles"].append(list(key))
+                tiles[key] = tile
+
+        try:
+            os.makedirs(self.tile_dir, exist_ok=True)
+            for (col, row), tile in tiles.items():
+                pygame.image.save(tile, self.tile_path(col, row))
+            with open(path.join(self.tile_dir, 'manifest.json'), 'w') as f:
+                f.write(json.dumps(manifest))
+        except (OSError, pygame.error) as e:
+            print(f"Could not write the ground cache ({e}), keeping "
+                  f"{path.basename(self.image_path)} in memory")
+            self.fallback = tiles
+
+        return manifest
+
+    def tile_path(self, col: int, row: int) -> str:
+        return path.join(self.tile_dir, f'{col}_{row}.png')
+
+    def tile_rect(self, col: int, row: int) -> pygame.Rect:
+        rect = pygame.Rect(col * GROUND_TILE_SIZE, row * GROUND_TILE_SIZE,
+                           GROUND_TILE_SIZE, GROUND_TILE_SIZE)
+        return rect.clip(pygame.Rect((0, 0), self.size))
+
+    def tile(self, col: int, row: int) -> pygame.Surface:
+        """
+        :return: converted surface of a tile, decoded if it is not cached
+        """
+        def load():
+            if self.fallback is not None:
+                return self.fallback[(col, row)].convert_alpha()
+            with asset_lock:
+                decoded = self.decoded.pop((col, row), None)
+            if decoded is None:
+                decoded = pygame.image.load(self.tile_path(col, row))
+            return decoded.convert_alpha()
+
+        return ground_cache.get((self.image_path, col, row), load)
+
+    def preload(self, area: pygame.Rect):
+        """
+        Decodes the tiles covering an area without converting them, so it can
+        run on a worker thread. tile finishes the conversion when drawn.
+        :param area: part of the image in world coordinates
+        :return: None
+        """
+        if self.fallback is not None:
+            return
+
+        tiles = {tuple(key) for key in self.manifest["tiles"]}
+        size = GROUND_TILE_SIZE
+        for col in range(max(area.left, 0) // size, area.right // size + 1):
+            for row in range(max(area.top, 0) // size,
+                             area.bottom // size + 1):
+                if (col, row) not in tiles or \
+                        (self.image_path, col, row) in ground_cache.surfaces:
+                    continue
+                decoded = pygame.image.load(self.tile_path(col, row))
+                with asset_lock:
+                    self.decoded.setdefault((col, row), decoded)
+
+    def create_sprites(self, groups, z: int = LAYERS['ground']):
+        """
+        Adds one GroundChunk per non-empty tile
+        :return: None
+        """
+        for col, row in self.manifest["tiles"]:
+            GroundChunk(self, col, row, groups, z)
+
+
+class GroundChunk(pygame.sprite.Sprite):
+    """
+    One tile of a GroundTiles image, its image is only decoded when the
+    camera draws it.
+    """
+
+    def __init__(self, ground: GroundTiles, col: int, row: int, groups,
+                 z: int):
+        super().__init__(groups)
+        self.ground = ground
+        self.col, self.row = col, row
+        self.rect = ground.tile_rect(col, row)
+        self.z = z
+
+    @property
+    def image(self) -> pygame.Surface:
+        return self.ground.tile(self.col, self.row)
+
+
+class OverlayChunk(pygame.sprite.Sprite):
+    """
+    STATIC_CHUNK_SIZE square of a TileOverlay, its tiles are composited into
+    one image which is only redrawn after one of them changed
+    """
+
+    def __init__(self, topleft: tuple[int, int], groups, z: int):
+        super().__init__(groups)
+        self.rect = pygame.Rect(topleft, (STATIC_CHUNK_SIZE,
+                                          STATIC_CHUNK_SIZE))
+        self.z = z
+        # (column, row) -> surface of the tile
+        self.tiles = {}
+        self.surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        self.dirty = True
+
+    @property
+    def image(self) -> pygame.Surface:
+        if self.dirty:
+            self.redraw()
+        return self.surface
+
+    def redraw(self):
+        """
+        :return: None
+        """
+        self.surface.fill((0, 0, 0, 0))
+        for (x, y), surf in self.tiles.items():
+            self.surface.blit(surf, (x * TILE_SIZE - self.rect.x,
+                                     y * TILE_SIZE - self.rect.y))
+        self.dirty = False
+
+
+class TileOverlay:
+    """
+    Layer of tiles which change while playing (tilled soil, wet soil) drawn
+    through a few OverlayChunk sprites instead of one sprite per tile.
+    Chunks are created with their first tile and dropped with their last.
+    """
+
+    def __init__(self, groups, z: int):
+        self.groups = groups
+        self.z = z
+        # (chunk column, chunk row) -> OverlayChunk
+        self.chunks = {}
+
+    def __contains__(self, tile: tuple[int, int]):
+        chunk = self.chunks.get(self.chunk_key(*tile))
+        return chunk is not None and tile in chunk.tiles
+
+    def __len__(self):
+        return sum(len(chunk.tiles) for chunk in self.chunks.values())
+
+    @staticmethod
+    def chunk_key(x: int, y: int) -> tuple[int, int]:
+        """
+        :return: key of the chunk holding the tile at column x and row y
+        """
+        return (x * TILE_SIZE // STATIC_CHUNK_SIZE,
+                y * TILE_SIZE // STATIC_CHUNK_SIZE)
+
+    def set_tile(self, x: int, y: int, surf: pygame.Surface):
+        """
+        Draws a tile, replacing the one already there
+        :return: None
+        """
+        key = self.chunk_key(x, y)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            chunk = self.chunks[key] = OverlayChunk(
+                (key[0] * STATIC_CHUNK_SIZE, key[1] * STATIC_CHUNK_SIZE),
+                self.groups, self.z)
+        if chunk.tiles.get((x, y)) is not surf:
+            chunk.tiles[(x, y)] = surf
+            chunk.dirty = True
+
+    def remove_tile(self, x: int, y: int):
+        """
+        Erases a tile, does nothing if there is none
+        :return: None
+        """
+        key = self.chunk_key(x, y)
+        chunk = self.chunks.get(key)
+        if chunk is None or (x, y) not in chunk.tiles:
+            return
+
+        del chunk.tiles[(x, y)]
+        chunk.dirty = True
+        if not chunk.tiles:
+            chunk.kill()
+            del self.chunks[key]
+
+    def clear(self):
+        """
+        Erases every tile
+        :return: None
+        """
+        for chunk in self.chunks.values():
+            chunk.kill()
+        self.chunks = {}
@@ -0,0 +1,121 @@
+# Copyright (c) 2025 Your Name
+# Licensed under the AGPLv3 License. See LICENSE file for details.
+#
+# This project is based on a tutorial (link: https://www.youtube.com/watch?v=T4IX36sP_0c).
+# You can redistribute and/or modify it under the terms of the AGPLv3.
+#
+# This software comes with no warranty. See the LICENSE file for more information.
+
+import pygame
+from game_code.settings import *
+
+# hitbox of a single collision tile, relative to the tile, same as Generic
+TILE_HITBOX = pygame.Rect(0, 0, TILE_SIZE, TILE_SIZE).inflate(
+    -TILE_SIZE * 0.2, -TILE_SIZE * 0.75)
+
+
+class OccupancyGrid:
+    """
+    One byte per tile of a map layer, set where the layer has a tile.
+    Replaces the sprites which were created for every tile of the collision
+    layers only to be tested against.
+    """
+
+    def __init__(self, cells: bytes, width: int, height: int,
+                 tile_size: int = TILE_SIZE):
+        self.cells = bytearray(cells)
+        self.width = width
+        self.height = height
+        self.tile_size = tile_size
+
+    @classmethod
+    def from_map(cls, tiled_map, grid_name: str):
+        """
+        :param tiled_map: CompiledMap
+        :param grid_name: key of TMX_GRID_LAYERS
+        :return: the grid of the layer, empty if the map does not have it
+        """
+        cells = tiled_map.grids.get(grid_name,
+                                    bytes(tiled_map.width * tiled_map.height))
+        return cls(cells, tiled_map.width, tiled_map.height)
+
+    def occupied(self, x: int, y: int) -> bool:
+        """
+        :param x: tile column
+        :param y: tile row
+        :return: True if the tile is set, tiles off the map are never set
+        """
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return bool(self.cells[y * self.width + x])
+        return False
+
+    def occupied_at(self, position) -> bool:
+        """
+        :param position: point in world coordinates
+        :return: True if the point is inside a set tile
+        """
+        return self.occupied(int(position[0] // self.tile_size),
+                             int(position[1] // self.tile_size))
+
+    def merged_rects(self) -> list[tuple[int, int, int, int]]:
+        """
+        Covers the set tiles with as few rectangles as it greedily can. Every
+        rectangle is grown right as far as the row allows, then down as long
+        as the rows below are set over the same columns.
+        :return: x, y, width and height of every rectangle, in tiles
+        """
+        width, height = self.width, self.height
+        todo = bytearray(self.cells)
+        rects = []
+        for y in range(height):
+            row = y * width
+            x = 0
+            while x < width:
+                if not todo[row + x]:
+                    x += 1
+                    continue
+
+                end = x + 1
+                while end < width and todo[row + end]:
+                    end += 1
+
+                bottom = y + 1
+                while bottom < height and \
+                        all(todo[bottom * width + x:bottom * width + end]):
+                    bottom += 1
+
+                for merged_y in range(y, bottom):
+                    start = merged_y * width
+                    todo[start + x:start + end] = bytes(end - x)
+                rects.append((x, y, end - x, bottom - y))
+                x = end
+        return rects
+
+
+class Collider(pygame.sprite.Sprite):
+    """
+    Invisible block of collision tiles. Its hitbox is the block inset on its
+    outer edges like the hitbox of a single tile, the gaps the tiles' own
+    hitboxes leave between each other are closed since the player is too big
+    to fit through them anyway.
+    """
+
+    def __init__(self, tile_rect: tuple[int, int, int, int], groups):
+        super().__init__(groups)
+        x, y, width, height = tile_rect
+        self.rect = pygame.Rect(x * TILE_SIZE, y * TILE_SIZE,
+                                width * TILE_SIZE, height * TILE_SIZE)
+        self.hitbox = pygame.Rect(
+            self.rect.x + TILE_HITBOX.x, self.rect.y + TILE_HITBOX.y,
+            (width - 1) * TILE_SIZE + TILE_HITBOX.width,
+            (height - 1) * TILE_SIZE + TILE_HITBOX.height)
+
+
+def create_colliders(grid: OccupancyGrid, groups) -> list[Collider]:
+    """
+    :param grid: collision tiles of the map
+    :param groups: groups the colliders are added to
+    :return: one collider for every merged rectangle of the grid
+    """
+    return [Collider(tile_rect, groups)
+            for tile_rect in grid.merged_rects()]
@@ -13,6 +13,7 @@ import pygame.key
 from game_code.timer import Timer
 from random import randint
 from game_code.settings import CURR_PATH
+from game_code.sound import load_sound
 
 class Fishing:
     """
@@ -34,7 +35,7 @@ class Fishing:
 
         # splash sound
         curr_path = path.join(CURR_PATH, "audio", "fish flap.wav")
-        self.splash = pygame.mixer.Sound(curr_path)
+        self.splash = load_sound(curr_path)
 
         self.fishing_theme = fishing_theme
 
@@ -11,7 +11,7 @@ from game_code.player import Player
 from game_code.overlay import Overlay
 from game_code.sprites import Generic, Water, WildFlower, Tree, Interaction, Particle
 from game_code.mobs import Slime, Cow
-from pytmx.util_pygame import load_pygame
+from game_code.tmx_cache import load_map
 from game_code.support import *
 from game_code.transition import Transition
 from game_code.soil import SoilLayer
@@ -19,6 +19,19 @@ from game_code.sky import Rain, Sky
 from random import randint
 from game_code.menu import Menu, Inventory
 from game_code.timer import Timer
+from game_code.spatial import IndexedGroup
+from game_code.render import RenderLayers
+from game_code.chunks import bake_tile_layers
+from game_code.map_data import map_info
+from game_code.sound import load_sound
+from game_code.music import MusicManager
+from game_code.map_state import MapState, MapCache
+from game_code.preload import MapPreloader
+from game_code.collision import OccupancyGrid, create_colliders
+from game_code.world_query import WorldQuery
+from game_code.save_worker import SaveWorker
+from game_code.save_slot import SaveSlot
+from game_code.soil_store import create_soil_store
 from os import path
 
 
@@ -27,40 +40,34 @@ class Level:
         # Get display surface
         self.display_surface = pygame.display.get_surface()
 
-        # sprite groups
-        self.all_sprites = CameraGroup()
-        self.collision_sprites = pygame.sprite.Group()
-        self.tree_sprites = pygame.sprite.Group()
-        self.water_sprites = pygame.sprite.Group()
-        self.interaction_sprites = pygame.sprite.Group()
-        self.slime_sprites = pygame.sprite.Group()  # used in forest, for now
-        self.cow_sprites = pygame.sprite.Group()
+        # sprite groups, replaced by the groups of the active map
+        self.create_groups()
+        # lookups by point or rect in the groups of the active map
+        self.world = WorldQuery()
+
+        # maps already built, see setup
+        self.map_states = MapCache()
+        self.preloader = MapPreloader()
 
         self.soil_layer = None
         self.level_no = 0
 
+        # sky
+        self.sky = Sky()
+
         # inventory
         self.inventory = None
         self.overlay = None
 
         # timer
         self.autosave_timer = Timer(120000, self.auto_save)
+        # the farm and the player, written off the main thread
+        self.save_slot = SaveSlot(SaveWorker(), create_soil_store())
 
         # music
         norm = os.path.normpath
-        self.success = pygame.mixer.Sound(norm(CURR_PATH +
-                                               '/audio/success.wav'))
-        self.success.set_volume(0.3)
-        self.music = pygame.mixer.Sound(norm(CURR_PATH + '/audio/music.mp3'))
-        self.music.set_volume(0.3)
-        self.music.play(loops=-1)
-        self.night_music = pygame.mixer.Sound(norm(CURR_PATH +
-                                                   '/audio/nighttime.wav'))
-        self.fishing_theme = pygame.mixer.Sound(norm(CURR_PATH +
-                                                     '/audio/fishing theme.mp3'))
-        self.forest_theme = pygame.mixer.Sound(norm(CURR_PATH +
-                                                    '/audio/bg.mp3'))
-        self.active_music = self.music
+        self.success = load_sound(norm(CURR_PATH + '/audio/success.wav'), 0.3)
+        self.music = MusicManager()
         self.fishing_theme_on = False
 
         # mobs stuff
@@ -70,44 +77,107 @@ class Level:
         self.initial_set_up = True
         self.setup()
 
+    def create_groups(self):
+        """
+        Creates empty sprite groups for a map being built
+        :return: None
+        """
+        self.all_sprites = CameraGroup()
+        # looked up by hitbox around the player, see Player.collision
+        self.collision_sprites = IndexedGroup(rect_attr='hitbox')
+        # looked up through self.world, see WorldQuery
+        self.tree_sprites = IndexedGroup()
+        self.water_sprites = IndexedGroup()
+        self.interaction_sprites = IndexedGroup()
+        # used in forest, for now
+        self.slime_sprites = IndexedGroup(rect_attr='hitbox')
+        self.cow_sprites = pygame.sprite.Group()
+
     def setup(self):
         """
-        Sets up the world using TMX
-        :param level_no: This refers to the current location, by default is 0
-        1 will be used for forest map
+        Makes self.level_no the active map. Maps are built the first time
+        they are visited and then kept in self.map_states, so going back to
+        a map only swaps the active sprite groups.
+        :return: None
         """
+        state = self.map_states.get(self.level_no)
+        if state is None:
+            self.preloader.wait(self.level_no)
+            state = self.build_map()
+            self.map_states.add(state)
+
+        # things shared by every map, built with the first one
+        if self.overlay is None:
+            self.overlay = Overlay(self.player, self.player.held_items)
+            self.transition = Transition(self.reset, self.player)
+            self.menu = Menu(self.player, self.toggle_shop)
+            self.inventory = Inventory(self.player, self.toggle_inventory,
+                                       self.player.held_items)
+
+        self.activate(state)
+
+    def activate(self, state: MapState):
+        """
+        Points the level and the player at the groups of a built map
+        :return: None
+        """
+        self.map_info = state.map_info
+        for name, group in state.groups.items():
+            setattr(self, name, group)
+        self.rain = state.rain
+
+        self.world.bind(trees=self.tree_sprites, water=self.water_sprites,
+                        slimes=self.slime_sprites,
+                        interactions=self.interaction_sprites)
+        self.player.map_swap(pos=state.player_start,
+                             sprite_dict=state.sprite_dict(self.soil_layer,
+                                                           self.world))
+        self.music.play('night' if self.sky.night else self.day_theme())
+
+        self.shop_active = False
+        self.inventory_active = False
+
+    def map_state(self, player_start: tuple) -> MapState:
+        """
+        :param player_start: where the player enters the map
+        :return: state holding the groups of the map just built
+        """
+        groups = {name: getattr(self, name) for name in
+                  ("all_sprites", "collision_sprites", "tree_sprites",
+                   "water_sprites", "interaction_sprites", "slime_sprites",
+                   "cow_sprites")}
+        soil_layer = self.soil_layer \
+            if self.level_no == MAP_NUMBERS["Starting"] else None
+        return MapState(self.level_no, self.map_info, groups, self.rain,
+                        player_start, soil_layer)
+
+    def build_map(self) -> MapState:
+        """
+        Sets up the world of self.level_no using TMX
+        :return: the state of the new map
+        """
+        self.map_info = map_info(self.level_no)
         if self.level_no == MAP_NUMBERS["Starting"]:
-            self.all_sprites = CameraGroup()
-            self.collision_sprites.empty()
-            self.tree_sprites.empty()
-            self.water_sprites.empty()
-            self.interaction_sprites.empty()
-            self.slime_sprites.empty()  # used in forest, for now
-            self.cow_sprites.empty()
+            self.create_groups()
 
             self.soil_layer = SoilLayer(self.all_sprites,
-                                        self.collision_sprites)
+                                        self.collision_sprites,
+                                        self.save_slot)
 
-            tmx_data = load_pygame(path.join(CURR_PATH, 'data', 'map.tmx'))
+            tmx_data = load_map(self.map_info.tmx_path)
 
             # house
-            for layer in ['HouseFloor', 'HouseFurnitureBottom']:
-                for x, y, surf in tmx_data.get_layer_by_name(layer) \
-                        .tiles():
-                    Generic((x * TILE_SIZE, y * TILE_SIZE), surf,
-                            self.all_sprites,
-                            LAYERS['house bottom'])
-
-            for layer in ['HouseWalls', 'HouseFurnitureTop']:
-                for x, y, surf in tmx_data.get_layer_by_name(layer) \
-                        .tiles():
-                    Generic((x * TILE_SIZE, y * TILE_SIZE), surf,
-                            self.all_sprites)
-
-            # Fence
+            bake_tile_layers(tmx_data, ['HouseFloor', 'HouseFurnitureBottom'],
+                             self.all_sprites, LAYERS['house bottom'])
+            bake_tile_layers(tmx_data, ['HouseWalls', 'HouseFurnitureTop'],
+                             self.all_sprites, LAYERS['main'], y_sorted=True)
+
+            # Fence, drawn baked and collided with per tile
+            bake_tile_layers(tmx_data, ['Fence'], self.all_sprites,
+                             LAYERS['main'], y_sorted=True)
             for x, y, surf in tmx_data.get_layer_by_name('Fence').tiles():
                 Generic((x * TILE_SIZE, y * TILE_SIZE), surf,
-                        [self.all_sprites, self.collision_sprites])
+                        self.collision_sprites)
 
             # Water
             water_frames = import_folder(path.join(CURR_PATH, 'graphics',
@@ -135,10 +205,9 @@ class Level:
                 WildFlower((obj.x, obj.y), obj.image,
                            [self.all_sprites, self.collision_sprites])
 
-            # collision tiles
-            for x, y, surf in tmx_data.get_layer_by_name('Collision').tiles():
-                Generic((x * TILE_SIZE, y * TILE_SIZE), pygame.Surface(
-                    (TILE_SIZE, TILE_SIZE)), self.collision_sprites)
+            # collision tiles, merged into a few invisible colliders
+            create_colliders(OccupancyGrid.from_map(tmx_data, 'collision'),
+                             self.collision_sprites)
 
             # Player
             sprite_dict = {"group": self.all_sprites,
@@ -147,6 +216,7 @@ class Level:
                            "water_sprites": self.water_sprites,
                            "interaction": self.interaction_sprites,
                            "soil_layer": self.soil_layer,
+                           "world": self.world,
                            "slime_sprites": self.slime_sprites,
                            "cow_sprites": self.cow_sprites}
 
@@ -197,16 +267,12 @@ class Level:
             cow_variable.setup_important_positions("CowAreaMarker",
                                                    cow_area_marker_var)
 
-            collision_cow_sprites = pygame.sprite.Group()
-            for x, y, surf in tmx_data.get_layer_by_name('CowCollision'):
-                if surf != 0:
-                    Generic((x * TILE_SIZE, y * TILE_SIZE), pygame.Surface(
-                        (TILE_SIZE, TILE_SIZE)), collision_cow_sprites)
-
-            cow_variable.setup_cow_collision_tiles(collision_cow_sprites)
+            cow_variable.setup_cow_collision_tiles(
+                OccupancyGrid.from_map(tmx_data, 'cow collision'))
 
             for obj in tmx_data.get_layer_by_name('Player'):
                 if obj.name == 'Start':
+                    player_start = (obj.x, obj.y)
                     if self.initial_set_up:
                         self.player = Player(pos=(obj.x, obj.y),
                                              sprite_dict=sprite_dict,
@@ -216,11 +282,9 @@ class Level:
                                              get_map_level=self.get_map_number,
                                              set_map_level=self.set_map_number,
                                              play_fishing_theme=
-                                             self.play_fishing_theme)
+                                             self.play_fishing_theme,
+                                             save_slot=self.save_slot)
                         self.initial_set_up = False
-                    else:
-                        self.player.map_swap(pos=(obj.x, obj.y),
-                                             sprite_dict=sprite_dict)
 
                 elif obj.name == 'Bed':
                     Interaction((obj.x, obj.y), (obj.width, obj.height),
@@ -234,56 +298,28 @@ class Level:
                     Interaction((obj.x, obj.y), (obj.width, obj.height),
                                 self.interaction_sprites, obj.name)
 
-            Generic(
-                pos=(0, 0),
-                surf=pygame.image.load(
-                    path.join(CURR_PATH, 'graphics', 'world',
-                              'ground 2.png')).convert_alpha(),
-                groups=self.all_sprites, z=LAYERS['ground'])
-
-            self.active_music.stop()
-            self.active_music = self.music
-            self.active_music.set_volume(0.3)
-            self.active_music.play()
-
-            self.overlay = Overlay(self.player, self.player.held_items)
-            self.transition = Transition(self.reset, self.player)
+            self.map_info.ground.create_sprites(self.all_sprites)
 
             # sky
-            self.rain = Rain(self.all_sprites)
+            self.rain = Rain(self.all_sprites, self.map_info.bounds)
             self.raining = randint(0, 10) > -1
             self.soil_layer.raining = self.raining
             if (self.raining):
                 self.soil_layer.water_all()
-            self.sky = Sky()
             # adjust cow stuffs
             cow_variable.setup_time(self.sky.usable_time)
 
-            # shop
-            self.shop_active = False
-            self.menu = Menu(self.player, self.toggle_shop)
-
-            # inventory
-            self.inventory_active = False
-            self.inventory = Inventory(self.player, self.toggle_inventory,
-                                       self.player.held_items)
-
         else:
-            tmx_data = load_pygame(path.join(CURR_PATH,
-                                             'data', 'Tilesets', 'Forest.tmx'))
+            tmx_data = load_map(self.map_info.tmx_path)
 
-            self.all_sprites = CameraGroup()
-            self.collision_sprites.empty()
-            self.tree_sprites.empty()
-            self.water_sprites.empty()
-            self.interaction_sprites.empty()
-            self.slime_sprites.empty()  # used in forest, for now
-            self.cow_sprites.empty()
+            self.create_groups()
 
             # fences
+            bake_tile_layers(tmx_data, ['Fence'], self.all_sprites,
+                             LAYERS['main'], y_sorted=True)
             for x, y, surf in tmx_data.get_layer_by_name('Fence').tiles():
                 Generic((x * TILE_SIZE, y * TILE_SIZE), surf,
-                        [self.all_sprites, self.collision_sprites])
+                        self.collision_sprites)
 
             # Trees
             for obj in tmx_data.get_layer_by_name('Trees'):
@@ -295,10 +331,9 @@ class Level:
                     name=obj.name,
                     player_add=self.player_add)
 
-            # collision tiles
-            for x, y, surf in tmx_data.get_layer_by_name('Collision').tiles():
-                Generic((x * TILE_SIZE, y * TILE_SIZE), pygame.Surface(
-                    (TILE_SIZE, TILE_SIZE)), self.collision_sprites)
+            # collision tiles, merged into a few invisible colliders
+            create_colliders(OccupancyGrid.from_map(tmx_data, 'collision'),
+                             self.collision_sprites)
 
             # slime area
             self.mob_area["slime"] = [[], []]
@@ -323,9 +358,11 @@ class Level:
                            "water_sprites": self.water_sprites,
                            "interaction": self.interaction_sprites,
                            "soil_layer": self.soil_layer,
+                           "world": self.world,
                            "slime_sprites": self.slime_sprites}
             for obj in tmx_data.get_layer_by_name('Player'):
                 if obj.name == 'Start':
+                    player_start = (obj.x, obj.y)
                     if self.initial_set_up:
                         self.player = Player(pos=(obj.x, obj.y),
                                              sprite_dict=sprite_dict,
@@ -335,11 +372,9 @@ class Level:
                                              get_map_level=self.get_map_number,
                                              set_map_level=self.set_map_number,
                                              play_fishing_theme=
-                                             self.play_fishing_theme)
+                                             self.play_fishing_theme,
+                                             save_slot=self.save_slot)
                         self.initial_set_up = False
-                    else:
-                        self.player.map_swap(pos=(obj.x, obj.y),
-                                             sprite_dict=sprite_dict)
 
                 elif obj.name == 'Slime':
                     slime_frames = {
@@ -382,34 +417,14 @@ class Level:
                                 self.interaction_sprites, obj.name)
 
             # world
-            Generic(
-                pos=(0, 0),
-                surf=pygame.image.load(
-                    path.join(CURR_PATH, 'graphics', 'world',
-                              'Forest.png')).convert_alpha(),
-                groups=self.all_sprites, z=LAYERS['ground'])
-
-            self.active_music.stop()
-            self.active_music = self.forest_theme
-            self.active_music.set_volume(0.5)
-            self.active_music.play()
-
-            self.overlay = Overlay(self.player, self.player.held_items)
-            self.transition = Transition(self.reset, self.player)
+            self.map_info.ground.create_sprites(self.all_sprites)
 
             # sky
-            self.rain = Rain(self.all_sprites)
+            self.rain = Rain(self.all_sprites, self.map_info.bounds)
             self.raining = randint(0, 10) > 7
             self.soil_layer.raining = self.raining
-            self.sky = Sky()
-
-            # shop
-            self.shop_active = False
-            self.menu = Menu(self.player, self.toggle_shop)
 
-            # inventory
-            self.inventory_active = False
-            # self.inventory = Inventory(self.player, self.toggle_inventory)
+        return self.map_state(player_start)
 
     def play_fishing_theme(self):
         """
@@ -419,16 +434,20 @@ class Level:
         if self.player.fishing.fishing_status and \
                 not self.fishing_theme_on:
             self.fishing_theme_on = True
-            self.active_music.stop()
-            self.active_music = self.fishing_theme
-            self.active_music.play()
+            self.music.play('fishing')
         elif self.sky.night and not self.sky.music_swap and \
                 not self.fishing_theme_on:
-            self.active_music.stop()
-            self.active_music = self.night_music
+            self.music.play('night')
         elif not self.sky.night and not self.fishing_theme_on:
-            self.active_music.stop()
-            self.active_music.play()
+            self.music.play(self.day_theme())
+
+    def day_theme(self):
+        """
+        :return: name of the daytime theme of the current map
+        """
+        if self.level_no == MAP_NUMBERS["Forest"]:
+            return 'forest'
+        return 'day'
 
     def get_map_number(self):
         """
@@ -449,12 +468,20 @@ class Level:
 
     def auto_save(self):
         """
-        Autosave function for saving soil state
+        Autosave function for saving soil and player state, the snapshots
+        are written by the save worker so the frame does not wait on the disk
         :return: NoneType
         """
-        self.soil_layer.save_soil_state()
         self.autosave_timer.activate()
         self.player.auto_save_night()
+        self.save_slot.save(self.soil_layer, self.player)
+
+    def shutdown(self):
+        """
+        Called when the game is closed, writes every save still waiting
+        :return: None
+        """
+        self.save_slot.close()
 
     def player_add(self, item: str):
         """
@@ -495,8 +522,10 @@ class Level:
         if self.raining:
             self.soil_layer.water_all()
 
-        # apples on trees
-        for tree in self.tree_sprites.sprites():
+        # apples on trees, of every map kept in memory
+        trees = [tree for state in self.map_states
+                 for tree in state.groups["tree_sprites"].sprites()]
+        for tree in trees:
             try:
                 for apple in tree.apple_sprites.sprites():
                     apple.kill()
@@ -513,33 +542,20 @@ class Level:
         self.sky.start_color = [255, 255, 255]
         self.sky.reset_time()
         # night to day
-        self.active_music.stop()
-        self.active_music = self.music
-        self.active_music.play()
+        self.music.play(self.day_theme())
         self.sky.night = False
         self.fishing_theme_on = False
 
     def plant_collision(self):
         """
-        Code to change a land to being plowed
+        Harvests the fully grown plants the player walks into
         :return: None
         """
-        if self.soil_layer.plant_sprites:
-            for plant in self.soil_layer.plant_sprites.sprites():
-                if plant.harvestable and \
-                        plant.rect.colliderect(self.player.hitbox):
-                    self.player_add(plant.plant_type)
-                    plant.kill()
-                    Particle(plant.rect.midbottom, plant.image,
-                             self.all_sprites, LAYERS['main'])
-                    if plant.plant_type != "corn":
-                        x = plant.rect.centery // TILE_SIZE
-                        y = plant.rect.centerx // TILE_SIZE
-                    else:
-                        mid_bottom = plant.rect.midbottom
-                        x = mid_bottom[0] // TILE_SIZE
-                        y = mid_bottom[1] // TILE_SIZE
-                    self.soil_layer.grid[x][y].remove('P')
+        for plant in self.soil_layer.harvestable_in(self.player.hitbox):
+            self.player_add(plant.plant_type)
+            Particle(plant.rect.midbottom, plant.image,
+                     self.all_sprites, LAYERS['main'])
+            self.soil_layer.harvest(plant)
 
     def run(self, dt: float):
         """
@@ -562,6 +578,9 @@ class Level:
             self.all_sprites.update(dt)
             self.plant_collision()
             self.overlay.display(dt)
+            self.preloader.check_transitions(self.player.rect.center,
+                                             self.interaction_sprites,
+                                             self.map_states)
 
         # weather
         if self.raining and not self.shop_active and not self.inventory_active:
@@ -569,11 +588,10 @@ class Level:
 
         # daytime
         self.sky.display(dt)
+        self.music.update(dt)
         # nighttime
         if self.sky.night and not self.sky.music_swap:
-            self.active_music.stop()
-            self.active_music = self.night_music
-            self.active_music.play()
+            self.music.play('night')
             self.fishing_theme_on = False
             self.sky.music_swap = True
 
@@ -584,7 +602,7 @@ class Level:
             self.transition.play()
 
 
-class CameraGroup(pygame.sprite.Group):
+class CameraGroup(IndexedGroup):
     """
     This class is used to show the area in the players immediate vicinity
     """
@@ -593,40 +611,78 @@ class CameraGroup(pygame.sprite.Group):
         super().__init__()
         self.display_surface = pygame.display.get_surface()
         self.offset = pygame.math.Vector2()
+        self.culling = CAMERA_CULLING
+        self.view = self.display_surface.get_rect()
+        self.render_layers = RenderLayers()
+
+    def index_sprite(self, sprite):
+        super().index_sprite(sprite)
+        self.render_layers.place(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.render_layers.remove(sprite)
+
+    def sync(self):
+        """
+        Same as IndexedGroup.sync, moved sprites are also re-sorted in their
+        render layer. Static sprites are never re-sorted.
+        :return: None
+        """
+        super().sync()
+        for sprite in self.dynamic_sprites:
+            self.render_layers.place(sprite)
+
+    def visible_sprites(self):
+        """
+        Looks up the sprites touching the screen through the spatial hash, so
+        sprites far away from the player are never iterated. The drawing order
+        comes from the render layers, limited to the rows around the screen.
+        :return: visible sprites in drawing order
+        """
+        self.view.topleft = (int(self.offset.x), int(self.offset.y))
+        view = self.view.inflate(2, 2)
+        visible = self.in_rect(view)
+        return (sprite for sprite in
+                self.render_layers.ordered_in_band(view.top, view.bottom)
+                if sprite in visible)
 
     def custom_draw(self, player):
         self.offset.x = player.rect.centerx - SCREEN_WIDTH / 2
         self.offset.y = player.rect.centery - SCREEN_HEIGHT / 2
-        for layer in LAYERS.values():
-            for sprite in sorted(self.sprites(),
-                                 key=lambda sprite: sprite.rect.centery):
-                if sprite.z == layer:
-                    offset_rect = sprite.rect.copy()
-                    offset_rect.center -= self.offset
-                    self.display_surface.blit(sprite.image, offset_rect)
-
-                    # analytics
-                    # slime = getattr(sprite, "slime", None)
-                    # if callable(slime):
-                    #     offset_rect = slime()
-                    #     offset_rect.center -= self.offset
-                    #     pygame.draw.rect(self.display_surface, 'red',
-                    #                      offset_rect, 5)
-                    # cow = getattr(sprite, "cow", None)
-                    # if callable(cow):
-                    #     offset_rect = cow()
-                    #     offset_rect.center -= self.offset
-                    #     pygame.draw.rect(self.display_surface, 'red',
-                    #                      offset_rect, 5)
-                    #
-                    # if sprite == player:
-                    #     pygame.draw.rect(self.display_surface, 'red',
-                    #                      offset_rect, 5)
-                    #     hitbox_rect = player.hitbox.copy()
-                    #     hitbox_rect.center = offset_rect.center
-                    #     pygame.draw.rect(self.display_surface, 'green',
-                    #                      hitbox_rect, 5)
-                    #     target_pos = offset_rect.center + PLAYER_TOOL_OFFSET[
-                    #         player.status.split('_')[0]]
-                    #     pygame.draw.circle(self.display_surface, 'blue',
-                    #                        target_pos, 5)
+        if self.culling:
+            sprites = self.visible_sprites()
+        else:
+            self.sync()
+            sprites = self.render_layers.ordered()
+
+        for sprite in sprites:
+            offset_rect = sprite.rect.copy()
+            offset_rect.center -= self.offset
+            self.display_surface.blit(sprite.image, offset_rect)
+
+            # analytics
+            # slime = getattr(sprite, "slime", None)
+            # if callable(slime):
+            #     offset_rect = slime()
+            #     offset_rect.center -= self.offset
+            #     pygame.draw.rect(self.display_surface, 'red',
+            #                      offset_rect, 5)
+            # cow = getattr(sprite, "cow", None)
+            # if callable(cow):
+            #     offset_rect = cow()
+            #     offset_rect.center -= self.offset
+            #     pygame.draw.rect(self.display_surface, 'red',
+            #                      offset_rect, 5)
+            #
+            # if sprite == player:
+            #     pygame.draw.rect(self.display_surface, 'red',
+            #                      offset_rect, 5)
+            #     hitbox_rect = player.hitbox.copy()
+            #     hitbox_rect.center = offset_rect.center
+            #     pygame.draw.rect(self.display_surface, 'green',
+            #                      hitbox_rect, 5)
+            #     target_pos = offset_rect.center + PLAYER_TOOL_OFFSET[
+            #         player.status.split('_')[0]]
+            #     pygame.draw.circle(self.display_surface, 'blue',
+            #                        target_pos, 5)
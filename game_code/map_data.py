@@ -0,0 +1,65 @@
+# Copyright (c) 2025 Your Name
+# Licensed under the AGPLv3 License. See LICENSE file for details.
+#
+# This project is based on a tutorial (link: https://www.youtube.com/watch?v=T4IX36sP_0c).
+# You can redistribute and/or modify it under the terms of the AGPLv3.
+#
+# This software comes with no warranty. See the LICENSE file for more information.
+
+from xml.etree import ElementTree
+
+import pygame
+from game_code.settings import *
+from game_code.chunks import GroundTiles
+from game_code.support import cached_asset
+from os import path
+
+
+def read_tmx_header(tmx_path: str) -> dict:
+    """
+    Reads the attributes of the <map> element only, the rest of the file is
+    never parsed.
+    :param tmx_path: path to the .tmx file
+    :return: dictionary of the map attributes
+    """
+    for _, element in ElementTree.iterparse(tmx_path, events=('start',)):
+        return element.attrib
+    raise ValueError(f"{tmx_path} has no map element")
+
+
+class MapInfo:
+    """
+    Size and files of a map, worked out without decoding any image.
+    The tile counts come from the TMX header and the ground image size from
+    the manifest of its tile cache (see GroundTiles).
+    """
+
+    def __init__(self, level_no: int):
+        tmx_name, ground_name = MAP_FILES[level_no]
+        self.tmx_path = path.join(CURR_PATH, 'data', tmx_name)
+        self.ground = GroundTiles(path.join(CURR_PATH, 'graphics', 'world',
+                                            ground_name))
+
+        header = read_tmx_header(self.tmx_path)
+        self.tiles_x = int(header['width'])
+        self.tiles_y = int(header['height'])
+        self.tile_width = int(header['tilewidth'])
+        self.tile_height = int(header['tileheight'])
+
+        # the ground image may be bigger than the tile layers (e.g. Forest)
+        ground_w, ground_h = self.ground.size
+        self.bounds = pygame.Rect(
+            0, 0, max(self.tiles_x * self.tile_width, ground_w),
+            max(self.tiles_y * self.tile_height, ground_h))
+
+
+# level_no -> MapInfo, each map is only read once per run
+_map_infos = {}
+
+
+def map_info(level_no: int) -> MapInfo:
+    """
+    :param level_no: map number from MAP_NUMBERS
+    :return: the cached information about the map
+    """
+    return cached_asset(_map_infos, level_no, lambda: MapInfo(level_no))
@@ -0,0 +1,94 @@
+# Copyright (c) 2025 Your Name
+# Licensed under the AGPLv3 License. See LICENSE file for details.
+#
+# This project is based on a tutorial (link: https://www.youtube.com/watch?v=T4IX36sP_0c).
+# You can redistribute and/or modify it under the terms of the AGPLv3.
+#
+# This software comes with no warranty. See the LICENSE file for more information.
+
+from collections import OrderedDict
+
+from game_code.settings import *
+
+
+class MapState:
+    """
+    The world of one map: its sprite groups, rain and where the player
+    enters it. While the player is on another map the state is kept as it
+    is, so its sprites simply stop being updated and drawn.
+    """
+
+    def __init__(self, level_no: int, map_info, groups: dict, rain,
+                 player_start: tuple, soil_layer=None):
+        self.level_no = level_no
+        self.map_info = map_info
+        # "all_sprites", "collision_sprites", etc. -> group, see Level
+        self.groups = groups
+        self.rain = rain
+        self.player_start = player_start
+        # SoilLayer built with the map, only the farm has one
+        self.soil_layer = soil_layer
+
+    def release(self):
+        """
+        Drops the sprites of a map leaving the cache, the farm is saved and
+        its store closed first since a rebuilt farm reads it again
+        :return: None
+        """
+        if self.soil_layer is not None:
+            self.soil_layer.close()
+        for group in self.groups.values():
+            group.empty()
+
+    def sprite_dict(self, soil_layer, world) -> dict:
+        """
+        :param soil_layer: soil layer of the farm
+        :param world: WorldQuery of the level
+        :return: the groups in the format used by the player
+        """
+        return {"group": self.groups["all_sprites"],
+                "collision_sprites": self.groups["collision_sprites"],
+                "tree_sprites": self.groups["tree_sprites"],
+                "water_sprites": self.groups["water_sprites"],
+                "interaction": self.groups["interaction_sprites"],
+                "soil_layer": soil_layer,
+                "world": world,
+                "slime_sprites": self.groups["slime_sprites"],
+                "cow_sprites": self.groups["cow_sprites"]}
+
+
+class MapCache:
+    """
+    Least recently used maps, at most MAX_RESIDENT_MAPS of them are kept.
+    The map being added is never the one dropped.
+    """
+
+    def __init__(self, max_resident: int = MAX_RESIDENT_MAPS):
+        self.max_resident = max(1, max_resident)
+        self.states = OrderedDict()
+
+    def __contains__(self, level_no: int):
+        return level_no in self.states
+
+    def __iter__(self):
+        return iter(list(self.states.values()))
+
+    def get(self, level_no: int):
+        """
+        :return: the resident state of the map, None if it has to be built
+        """
+        state = self.states.get(level_no)
+        if state is not None:
+            self.states.move_to_end(level_no)
+        return state
+
+    def add(self, state: MapState):
+        """
+        Keeps the state, dropping the least recently used maps over the limit
+        :return: None
+        """
+        self.states[state.level_no] = state
+        self.states.move_to_end(state.level_no)
+        while len(self.states) > self.max_resident:
+            _, dropped = self.states.popitem(last=False)
+            dropped.release()
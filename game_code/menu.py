@@ -11,6 +11,7 @@ from typing import Callable
 import pygame
 from game_code.settings import *
 from game_code.timer import Timer
+from game_code.support import load_image
 from game_code.player import Player
 from os import path
 
@@ -32,22 +33,19 @@ class Menu:
         self.topleft_offset = 128
 
         # menu image
-        self.menu_image = pygame.image.load(path.join(CURR_PATH, 'graphics',
-                                                      'menus', 'shop_2.png')
-                                            ).convert_alpha()
+        self.menu_image = load_image(path.join(CURR_PATH, 'graphics', 'menus',
+                                               'shop_2.png'))
         self.menu_rect = self.menu_image.get_rect(
             center=OVERLAY_POSITIONS['shop'])
         # status rects
         self.status_imgs = {
-            "tools": pygame.image.load(path.join(CURR_PATH, 'graphics', 'menus',
-                                                 'shop', 'tools.png')).convert_alpha(),
-            "unplantables": pygame.image.load(path.join(CURR_PATH, 'graphics',
-                                                        'menus', 'shop',
-                                                        'unplantables.png')
-                                              ).convert_alpha(),
-            "plants": pygame.image.load(path.join(CURR_PATH, 'graphics',
-                                                  'menus', 'shop',
-                                                  'plants.png')).convert_alpha()
+            "tools": load_image(path.join(CURR_PATH, 'graphics', 'menus',
+                                          'shop', 'tools.png')),
+            "unplantables": load_image(path.join(CURR_PATH, 'graphics',
+                                                 'menus', 'shop',
+                                                 'unplantables.png')),
+            "plants": load_image(path.join(CURR_PATH, 'graphics', 'menus',
+                                           'shop', 'plants.png'))
         }
         self.status_rects = {
             "tools": self.status_imgs["tools"].get_rect(
@@ -65,28 +63,18 @@ class Menu:
         # menu arrows
         curr_path = path.join(CURR_PATH, 'graphics', 'menus', 'shop')
         self.shop_imgs = {
-            "left": pygame.image.load(path.join(curr_path, 'left_arrow.png')
-                                      ).convert_alpha(),
-            "left_p": pygame.image.load(path.join(curr_path,
-                                                  'left_arrow_pressed.png')
-                                        ).convert_alpha(),
-            "right": pygame.image.load(path.join(curr_path, 'right_arrow.png')
-                                       ).convert_alpha(),
-            "right_p": pygame.image.load(path.join(curr_path,
-                                                   'right_arrow_pressed.png')
-                                         ).convert_alpha(),
-            "plus": pygame.image.load(path.join(curr_path, 'plus.png')
-                                      ).convert_alpha(),
-            "plus_p": pygame.image.load(path.join(curr_path, 'plus_pressed.png')
-                                        ).convert_alpha(),
-            "minus": pygame.image.load(path.join(curr_path, 'minus.png')
-                                       ).convert_alpha(),
-            "minus_p": pygame.image.load(path.join(curr_path, 'minus_pressed.png')
-                                         ).convert_alpha(),
-            "exit": pygame.image.load(path.join(curr_path, 'exit_shop.png')
-                                      ).convert_alpha(),
-            "exit_p": pygame.image.load(path.join(curr_path, 'exit_shop_pressed.png')
-                                        ).convert_alpha()
+            "left": load_image(path.join(curr_path, 'left_arrow.png')),
+            "left_p": load_image(path.join(curr_path,
+                                           'left_arrow_pressed.png')),
+            "right": load_image(path.join(curr_path, 'right_arrow.png')),
+            "right_p": load_image(path.join(curr_path,
+                                            'right_arrow_pressed.png')),
+            "plus": load_image(path.join(curr_path, 'plus.png')),
+            "plus_p": load_image(path.join(curr_path, 'plus_pressed.png')),
+            "minus": load_image(path.join(curr_path, 'minus.png')),
+            "minus_p": load_image(path.join(curr_path, 'minus_pressed.png')),
+            "exit": load_image(path.join(curr_path, 'exit_shop.png')),
+            "exit_p": load_image(path.join(curr_path, 'exit_shop_pressed.png'))
         }
         calc_height_diff = self.shop_imgs["left"].get_height() \
                            - self.shop_imgs["left_p"].get_height()
@@ -460,37 +448,30 @@ class Inventory:
 
         # imports
         self.item_surfs = {
-            item: pygame.image.load(path.join(
-                CURR_PATH, 'graphics', 'menus', 'inventory', f'{item}.png')
-            ).convert_alpha()
+            item: load_image(path.join(CURR_PATH, 'graphics', 'menus',
+                                       'inventory', f'{item}.png'))
             for item in player.item_inventory
         }
 
         overlay_path = path.join(CURR_PATH, 'graphics', 'overlay')
 
         self.tools_surf = {
-            tool: pygame.image.load(path.join(overlay_path, 'tools',
-                                              f'{tool}.png')
-                                    ).convert_alpha()
+            tool: load_image(path.join(overlay_path, 'tools', f'{tool}.png'))
             for tool in player.tools
         }
         self.seeds_surf = {
-            seed: pygame.image.load(path.join(overlay_path,
-                                              f'{seed}.png')).convert_alpha()
+            seed: load_image(path.join(overlay_path, f'{seed}.png'))
             for seed in player.seeds}
 
-        self.inventory_image = pygame.image.load(path.join(CURR_PATH,
-                                                           'graphics',
-                                                           'menus',
-                                                           'extended UI.png')
-                                                 ).convert_alpha()
+        self.inventory_image = load_image(path.join(CURR_PATH, 'graphics',
+                                                    'menus',
+                                                    'extended UI.png'))
         self.inventory_rect = self.inventory_image.get_rect(midbottom=
                                                             OVERLAY_POSITIONS
                                                             ['inven'])
         # selection rectangle
-        self.box_img = pygame.image.load(path.join(CURR_PATH, 'graphics',
-                                                   'menus', 'selector.png')
-                                         ).convert_alpha()
+        self.box_img = load_image(path.join(CURR_PATH, 'graphics', 'menus',
+                                            'selector.png'))
         self.box_rect = self.box_img.get_rect(topleft=
                                               self.inventory_rect.topleft +
                                               Vector2(26, 25))
@@ -13,9 +13,12 @@ import pygame
 from game_code.timer import Timer
 from random import choice, randint, choices
 from game_code.settings import CURR_PATH
+from game_code.sound import load_sound
 
 
 class NeutralMob(pygame.sprite.Sprite):
+    dynamic = True
+
     def __init__(self, pos, frames, groups: pygame.sprite.Group, z,
                  player_pos: Callable = None):
         self.frames = frames
@@ -55,8 +58,7 @@ class Slime(NeutralMob):
         self.reduce_player_hp = reduce_player_hp
 
         # sounds
-        self.axe_sound = pygame.mixer.Sound(path.join(CURR_PATH, 'audio',
-                                                      'axe.mp3'))
+        self.axe_sound = load_sound(path.join(CURR_PATH, 'audio', 'axe.mp3'))
 
     def animate(self, dt: float):
         self.frame_index += 5 * dt
@@ -136,6 +138,8 @@ class Slime(NeutralMob):
         self.player_dmg_timer.update()
         self.move()
         self.animate(dt)
+        # looked up by hitbox when the player swings the axe
+        self.slime()
 
 
 class Cow(NeutralMob):
@@ -164,7 +168,8 @@ class Cow(NeutralMob):
         }
         self.current_job = "pathing_origin"
         self.times_complete = 3
-        self.collision_tiles = pygame.sprite.Group()
+        # tiles the target path can be in, see setup_cow_collision_tiles
+        self.collision_tiles = None
 
     def setup_time(self, curr_time: list[int, int]):
         """
@@ -183,7 +188,7 @@ class Cow(NeutralMob):
     def setup_cow_collision_tiles(self, collision_tiles):
         """
         Sets up valid locations for the cow target path to be in.
-        :param collision_tiles: valid location tiles
+        :param collision_tiles: OccupancyGrid of the valid location tiles
         """
         self.collision_tiles = collision_tiles
 
@@ -193,11 +198,9 @@ class Cow(NeutralMob):
         :param position:
         :return: bool indicating if there was a point of collision
         """
-        for tile in self.collision_tiles.sprites():
-            if tile.rect.collidepoint(position):
-                return True
-
-        return False
+        if self.collision_tiles is None:
+            return False
+        return self.collision_tiles.occupied_at(position)
 
     def target_pathfind_morning(self):
         """
@@ -0,0 +1,111 @@
+# Copyright (c) 2025 Your Name
+# Licensed under the AGPLv3 License. See LICENSE file for details.
+#
+# This project is based on a tutorial (link: https://www.youtube.com/watch?v=T4IX36sP_0c).
+# You can redistribute and/or modify it under the terms of the AGPLv3.
+#
+# This software comes with no warranty. See the LICENSE file for more information.
+
+import pygame
+from game_code.settings import *
+from os import path
+
+
+class MusicManager:
+    """
+    Plays the background themes through pygame.mixer.music, which streams
+    the file from disk instead of decoding the whole track into memory.
+    The mixer only streams one track at a time, so changing theme fades the
+    current one out and then fades the next one in.
+    """
+
+    def __init__(self, tracks: dict = None, fade_ms: int = MUSIC_FADE_MS):
+        self.tracks = MUSIC_TRACKS if tracks is None else tracks
+        self.fade_ms = fade_ms
+
+        # name of the track streaming, and of the one waiting for the fade out
+        self.current = None
+        self.next = None
+        # fade level of the current track, from 0 to 1
+        self.fade = 0.0
+        # volume set by the player, e.g. 0 when muted
+        self.master_volume = 1.0
+
+    def play(self, name: str):
+        """
+        Switches to a theme, does nothing if it is already the one playing
+        :param name: key of MUSIC_TRACKS
+        :return: None
+        """
+        if name == self.current:
+            # cancels a fade out, update fades it back in
+            self.next = None
+            return
+
+        if self.current is None:
+            # nothing to fade from, e.g. the first theme of the game which
+            # plays on the title screen where update is not called
+            self.start(name, fade_in=False)
+        else:
+            # fades the current track out first, see update
+            self.next = name
+
+    def start(self, name: str, fade_in: bool = True):
+        """
+        Loads a track and starts streaming it
+        :param fade_in: start silently and let update fade it in, False
+        plays it at full volume right away
+        :return: None
+        """
+        self.next = None
+        file_name, _ = self.tracks[name]
+        try:
+            pygame.mixer.music.load(path.join(CURR_PATH, 'audio', file_name))
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Could not play {file_name}: {e}")
+            pygame.mixer.music.stop()
+            self.current = None
+            return
+
+        self.current = name
+        self.fade = 0.0 if fade_in else 1.0
+        self.apply_volume()
+        pygame.mixer.music.play(loops=-1)
+
+    def set_volume(self, volume: float):
+        """
+        :param volume: master volume between 0 and 1, applies to every theme
+        :return: None
+        """
+        self.master_volume = volume
+        self.apply_volume()
+
+    def apply_volume(self):
+        if self.current is None:
+            return
+
+        _, track_volume = self.tracks[self.current]
+        pygame.mixer.music.set_volume(track_volume * self.fade *
+                                      self.master_volume)
+
+    def update(self, dt: float):
+        """
+        Moves the fade along, called every frame
+        :param dt: delta time
+        :return: None
+        """
+        if self.current is None:
+            return
+
+        step = dt * 1000 / self.fade_ms if self.fade_ms > 0 else 1
+        if self.next is not None:
+            self.fade = max(0.0, self.fade - step)
+            if self.fade == 0:
+                self.start(self.next)
+                return
+        elif self.fade < 1:
+            self.fade = min(1.0, self.fade + step)
+        else:
+            return
+
+        self.apply_volume()
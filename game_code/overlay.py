@@ -7,7 +7,7 @@
 # This software comes with no warranty. See the LICENSE file for more information.
 
 import pygame
-from game_code.support import import_folder_dict2
+from game_code.support import import_folder_dict2, load_image
 from game_code.settings import *
 from game_code.player import Player
 from game_code.timer import Timer
@@ -31,14 +31,11 @@ class Overlay:
         # imports
         overlay_path = path.join(CURR_PATH, 'graphics', 'overlay')
         self.tools_surf = {
-            tool: pygame.image.load(path.join(overlay_path, 'tools',
-                                              f'{tool}.png')
-                                    ).convert_alpha()
+            tool: load_image(path.join(overlay_path, 'tools', f'{tool}.png'))
             for tool in player.tools
         }
         self.seeds_surf = {
-            seed: pygame.image.load(path.join(overlay_path,
-                                              f'{seed}.png')).convert_alpha()
+            seed: load_image(path.join(overlay_path, f'{seed}.png'))
             for seed in player.seeds
         }
 
@@ -46,25 +43,21 @@ class Overlay:
                                                'LycheeSoda.ttf'), 30)
 
         # toolbox overlay
-        self.overlay_surf = pygame.image.load(path.join(
-            overlay_path, 'tools',
-            'tools.png')
-        ).convert_alpha()
+        self.overlay_surf = load_image(path.join(overlay_path, 'tools',
+                                                 'tools.png'))
         self.overlay_rect = self.overlay_surf.get_rect(midbottom=
                                                        OVERLAY_POSITIONS
                                                        ['inven'])
 
-        self.box_img = pygame.image.load(path.join(overlay_path, 'tools',
-                                                   'selector.png')
-                                         ).convert_alpha()
+        self.box_img = load_image(path.join(overlay_path, 'tools',
+                                            'selector.png'))
         self.box_rect = self.box_img.get_rect(topleft=
                                               self.overlay_rect.topleft +
                                               Vector2(26, 25))
 
         # xp and level and held item overlay
-        self.xp_bar_surf = pygame.image.load(path.join(overlay_path,
-                                                       'stats', 'xp_bar.png')
-                                             ).convert_alpha()
+        self.xp_bar_surf = load_image(path.join(overlay_path, 'stats',
+                                                'xp_bar.png'))
         self.xp_bar_rect = self.xp_bar_surf.get_rect(midbottom=
                                                      self.overlay_rect.midtop)
         self.xp_no_surf = self.font.render(
@@ -75,33 +68,26 @@ class Overlay:
         self.display_item_held_timer = Timer(500)
 
         # health and gold section overlay
-        self.stats_overlay_surf = pygame.image.load(path.join(overlay_path,
-                                                              'stats', 'hp_gold.png')
-                                                    ).convert_alpha()
+        self.stats_overlay_surf = load_image(path.join(overlay_path, 'stats',
+                                                       'hp_gold.png'))
         self.stats_overlay_rect = self.stats_overlay_surf.get_rect(topleft=
                                                                    (0, 0))
         # heart surf
-        self.f_heart_surfs = [pygame.image.load(path.join(overlay_path,
-                                                          'stats',
-                                                          'heart.png')
-                                                ).convert_alpha()
+        self.f_heart_surfs = [load_image(path.join(overlay_path, 'stats',
+                                                   'heart.png'))
                               for _ in range(self.player.max_hp)]
         self.f_heart_rects = [heart.get_rect() for heart in self.f_heart_surfs]
-        self.h_heart_surfs = [pygame.image.load(path.join(overlay_path,
-                                                          'stats',
-                                                          'half_heart.png')
-                                                ).convert_alpha()
+        self.h_heart_surfs = [load_image(path.join(overlay_path, 'stats',
+                                                   'half_heart.png'))
                               for _ in range(self.player.max_hp)]
         self.h_heart_rects = [heart.get_rect() for heart in self.h_heart_surfs]
-        self.e_heart_surfs = [pygame.image.load(path.join(overlay_path, 'stats',
-                                                          'empty_heart.png')
-                                                ).convert_alpha()
+        self.e_heart_surfs = [load_image(path.join(overlay_path, 'stats',
+                                                   'empty_heart.png'))
                               for _ in range(self.player.max_hp)]
         self.e_heart_rects = [heart.get_rect() for heart in self.e_heart_surfs]
         # gold overlay
-        self.gold_img = pygame.image.load(path.join(overlay_path, 'stats',
-                                                    'gold.png')
-                                          ).convert_alpha()
+        self.gold_img = load_image(path.join(overlay_path, 'stats',
+                                             'gold.png'))
         self.gold_rect = self.gold_img.get_rect(bottomleft=
                                                 self.stats_overlay_rect.
                                                 bottomleft + Vector2(13, -11))
@@ -114,17 +100,15 @@ class Overlay:
                                                          + Vector2(5, 0))
 
         # stamina bar overlay
-        self.stamina_bar_img = pygame.image.load(path.join(overlay_path, 'stats',
-                                                           'stamina_bar.png')
-                                                 ).convert_alpha()
+        self.stamina_bar_img = load_image(path.join(overlay_path, 'stats',
+                                                    'stamina_bar.png'))
         self.stamina_bar_rect = self.stamina_bar_img.get_rect(bottomright=
                                                               OVERLAY_POSITIONS
                                                               ['stamina'])
 
         # character box
-        self.chara_box_surf = pygame.image.load(path.join(overlay_path, 'stats',
-                                                          'character_box.png')
-                                                ).convert_alpha()
+        self.chara_box_surf = load_image(path.join(overlay_path, 'stats',
+                                                   'character_box.png'))
         self.chara_box_rect = self.chara_box_surf.get_rect(bottomleft=
                                                            OVERLAY_POSITIONS
                                                            ['character_box'])
@@ -0,0 +1,236 @@
+# Copyright (c) 2025 Your Name
+# Licensed under the AGPLv3 License. See LICENSE file for details.
+#
+# This project is based on a tutorial (link: https://www.youtube.com/watch?v=T4IX36sP_0c).
+# You can redistribute and/or modify it under the terms of the AGPLv3.
+#
+# This software comes with no warranty. See the LICENSE file for more information.
+
+import heapq
+import math
+from array import array
+
+from game_code.settings import *
+from game_code.soil_grid import SoilGrid, WATERED
+
+# type id -> plant type, the id is what the store keeps per plant
+PLANT_TYPES = list(GROW_SPEED)
+PLANT_TYPE_IDS = {plant_type: type_id
+                  for type_id, plant_type in enumerate(PLANT_TYPES)}
+
+# most nights a plant can go between two growth events, a stage is at most
+# one age apart, so this is also how many nights of watering are remembered
+MAX_EVENT_NIGHTS = max(math.ceil(1 / speed) for speed in
+                       GROW_SPEED.values()) + 2
+
+# translate table turning the soil flags into 1 for watered tiles
+_WATERED_BYTES = bytes(1 if value & WATERED else 0 for value in range(256))
+
+
+def plant_stage(age: float) -> int:
+    """
+    :return: what a plant of this age looks like, its frame and whether it is
+    still drawn with BIG_PLANT_OFFSET
+    """
+    return int(age) * 2 + (age > 2)
+
+
+def grow_age(age: float, speed: float, max_age: float, nights: int) -> float:
+    """
+    :param nights: watered nights the plant grew for
+    :return: the age after those nights, added night by night like the
+    plants always grew so the stages fall on the same nights
+    """
+    for _ in range(nights):
+        age = min(age + speed, max_age)
+    return age
+
+
+def nights_to_change(age: float, speed: float, max_age: float, stage: int,
+                     harvestable: bool):
+    """
+    :param stage: plant_stage the sprite is drawn with, -1 before it first
+    grew
+    :return: watered nights until the plant looks different or becomes
+    harvestable, None if it never will
+    """
+    for nights in range(1, MAX_EVENT_NIGHTS + 1):
+        age = min(age + speed, max_age)
+        if plant_stage(age) != stage or (age >= max_age and not harvestable):
+            return nights
+        if age >= max_age:
+            return None
+    return None
+
+
+class PlantStore:
+    """
+    Growth state of every plant on the farm, kept as one array per field
+    instead of attributes spread over the Plant sprites. Each plant owns a
+    slot of the arrays, the slots of harvested plants are reused by the next
+    plants.
+
+    Plants are not visited every night. Every plant has one event in a
+    priority queue, on the first night it could reach its next stage if it
+    was watered every night until then. When the event is due, the nights
+    the tile was really watered are counted: the plant either reached the
+    stage, or its event is pushed back by the nights it stayed dry. Plants
+    whose tile was not watered at all wait for it to be watered instead.
+    """
+
+    def __init__(self, grid: SoilGrid):
+        self.grid = grid
+        # nights grown so far
+        self.night = 0
+        # night -> one byte per tile, 1 where the tile was watered that
+        # night, only the last MAX_EVENT_NIGHTS nights are kept
+        self.watered_nights = {}
+        # (night, slot, generation) of the next growth event of every plant
+        self.events = []
+        # tile -> slot of the plants waiting for their tile to be watered
+        self.waiting = {}
+
+        # slot -> Plant, None for free slots
+        self.plants = []
+        self.free_slots = []
+
+        self.type_ids = array('B')
+        # age of the plant on the night it was last checked
+        self.ages = array('d')
+        self.checked = array('l')
+        self.grow_speeds = array('d')
+        self.max_ages = array('d')
+        # index of the soil tile of the plant in grid.cells
+        self.tiles = array('l')
+        self.harvestable = array('B')
+        # plant_stage the sprite was last drawn with, -1 before it first grew
+        self.stages = array('b')
+        # bumped when a slot is freed, its queued event is then ignored
+        self.generations = array('L')
+
+    def __len__(self):
+        return len(self.plants) - len(self.free_slots)
+
+    def add(self, plant, tile: tuple[int, int], age: float,
+            max_age: int) -> int:
+        """
+        :param plant: Plant sprite drawing the entry
+        :param tile: column and row of the soil tile
+        :param age: starting age
+        :param max_age: age at which the plant can be harvested
+        :return: slot of the plant
+        """
+        # seeds are drawn with their first frame until they grow, older
+        # plants come from a save and are redrawn for their stage
+        values = (PLANT_TYPE_IDS[plant.plant_type], age, self.night,
+                  GROW_SPEED[plant.plant_type], max_age,
+                  tile[1] * self.grid.width + tile[0], age >= max_age,
+                  plant_stage(age) if age else -1)
+        fields = (self.type_ids, self.ages, self.checked, self.grow_speeds,
+                  self.max_ages, self.tiles, self.harvestable, self.stages)
+
+        if self.free_slots:
+            slot = self.free_slots.pop()
+            self.plants[slot] = plant
+            for field, value in zip(fields, values):
+                field[slot] = value
+        else:
+            slot = len(self.plants)
+            self.plants.append(plant)
+            for field, value in zip(fields, values):
+                field.append(value)
+            self.generations.append(0)
+
+        self.schedule(slot)
+        return slot
+
+    def remove(self, slot: int):
+        """
+        Frees the slot of a harvested plant, it no longer grows
+        :return: None
+        """
+        self.plants[slot] = None
+        self.generations[slot] += 1
+        if self.waiting.get(self.tiles[slot]) == slot:
+            del self.waiting[self.tiles[slot]]
+        self.free_slots.append(slot)
+
+    def schedule(self, slot: int):
+        """
+        Queues the next growth event of a plant checked this night
+        :return: None
+        """
+        nights = nights_to_change(self.ages[slot], self.grow_speeds[slot],
+                                  self.max_ages[slot], self.stages[slot],
+                                  bool(self.harvestable[slot]))
+        if nights is not None:
+            heapq.heappush(self.events, (self.night + nights, slot,
+                                         self.generations[slot]))
+
+    def watered_since(self, slot: int) -> int:
+        """
+        :return: nights the tile of the plant was watered since it was last
+        checked
+        """
+        tile = self.tiles[slot]
+        # plants without an event left are fully grown, older nights would
+        # not change them anyway
+        first = max(self.checked[slot], self.night - MAX_EVENT_NIGHTS) + 1
+        return sum(self.watered_nights[night][tile]
+                   for night in range(first, self.night + 1)
+                   if night in self.watered_nights)
+
+    def current_age(self, slot: int) -> float:
+        """
+        :return: age of the plant tonight, including the nights it grew
+        since it was last checked
+        """
+        return grow_age(self.ages[slot], self.grow_speeds[slot],
+                        self.max_ages[slot], self.watered_since(slot))
+
+    def grow(self) -> tuple[list[int], list[int], list[int]]:
+        """
+        Grows the farm by a night, plants on a watered tile age by their
+        grow speed up to their max age. Only the plants whose event is due
+        are looked at.
+        :return: slots whose stored age moved, slots whose sprite has to be
+        redrawn, and slots which just became harvestable
+        """
+        self.night += 1
+        watered_tiles = self.grid.cells.translate(_WATERED_BYTES)
+        self.watered_nights[self.night] = watered_tiles
+        self.watered_nights.pop(self.night - MAX_EVENT_NIGHTS, None)
+
+        # waiting plants whose tile got watered are checked tonight
+        for tile in [tile for tile in self.waiting if watered_tiles[tile]]:
+            slot = self.waiting.pop(tile)
+            heapq.heappush(self.events, (self.night, slot,
+                                         self.generations[slot]))
+
+        aged, redraw, ripened = [], [], []
+        while self.events and self.events[0][0] <= self.night:
+            _, slot, generation = heapq.heappop(self.events)
+            if generation != self.generations[slot]:
+                continue
+
+            watered = self.watered_since(slot)
+            if not watered:
+                self.waiting[self.tiles[slot]] = slot
+                continue
+
+            age = grow_age(self.ages[slot], self.grow_speeds[slot],
+                           self.max_ages[slot], watered)
+            if age != self.ages[slot]:
+                aged.append(slot)
+            self.ages[slot] = age
+            self.checked[slot] = self.night
+
+            if plant_stage(age) != self.stages[slot]:
+                self.stages[slot] = plant_stage(age)
+                redraw.append(slot)
+            if age >= self.max_ages[slot] and not self.harvestable[slot]:
+                self.harvestable[slot] = 1
+                ripened.append(slot)
+            self.schedule(slot)
+
+        return aged, redraw, ripened
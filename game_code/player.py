@@ -6,7 +6,6 @@
 #
 # This software comes with no warranty. See the LICENSE file for more information.
 
-import json
 import random
 from typing import Callable
 
@@ -15,14 +14,18 @@ from game_code.settings import *
 from game_code.support import *
 from game_code.timer import Timer
 from game_code.fishing import Fishing
+from game_code.sound import load_sound
+from game_code.save_slot import SaveSlot, TrackedDict
 from os import path
 
 class Player(pygame.sprite.Sprite):
+    # moves every frame, so indexed groups re-bucket it lazily
+    dynamic = True
 
     def __init__(self, pos, sprite_dict,
                  toggle_shop: Callable, toggle_inventory: Callable,
                  get_map_level: Callable, set_map_level: Callable,
-                 play_fishing_theme: Callable):
+                 play_fishing_theme: Callable, save_slot: SaveSlot):
         super().__init__(sprite_dict["group"])
 
         self.import_assets()
@@ -82,10 +85,12 @@ class Player(pygame.sprite.Sprite):
         self.selected_hand = self.held_items[0]
 
         # STATS
-        player_info = self.read_save_file()
-        self.player_stats = player_info["player stats"]
-        self.item_inventory = player_info["player items"]
-        self.seed_inventory = player_info["player seeds"]
+        player_info = save_slot.load_player()
+        # counting their changes, the save is only rewritten after one
+        self.player_stats = TrackedDict(player_info["player stats"])
+        self.item_inventory = TrackedDict(player_info["player items"])
+        self.seed_inventory = TrackedDict(player_info["player seeds"])
+        self.saved_version = self.save_version
 
         # interaction
         self.tree_sprites = sprite_dict["tree_sprites"]
@@ -94,16 +99,15 @@ class Player(pygame.sprite.Sprite):
         self.interaction = sprite_dict["interaction"]
         self.sleep = False
         self.soil_layer = sprite_dict["soil_layer"]
+        self.world = sprite_dict["world"]
         self.toggle_shop = toggle_shop
         self.toggle_inventory = toggle_inventory
 
         # sound
-        self.watering = pygame.mixer.Sound(path.join(CURR_PATH, 'audio',
-                                                     'water.mp3'))
-        self.watering.set_volume(0.2)
-        self.throw_bob = pygame.mixer.Sound(path.join(CURR_PATH, 'audio',
-                                                       'fishing.wav'))
-        self.throw_bob.set_volume(0.2)
+        self.watering = load_sound(path.join(CURR_PATH, 'audio', 'water.mp3'),
+                                   0.2)
+        self.throw_bob = load_sound(path.join(CURR_PATH, 'audio',
+                                              'fishing.wav'), 0.2)
 
     def map_swap(self, pos, sprite_dict):
         """
@@ -115,8 +119,9 @@ class Player(pygame.sprite.Sprite):
         :param sprite_dict: Dictionary containing sprites.
         :return: NoneType
         """
-        # re-initialize all sprites
-        super().__init__(sprite_dict["group"])
+        # leave the groups of the previous map, then join the new one
+        self.kill()
+        self.add(sprite_dict["group"])
 
         # change the player's rect, which changes the player's pos, and by
         # extension, the location of the hitbox
@@ -131,6 +136,7 @@ class Player(pygame.sprite.Sprite):
         self.slime_sprites = sprite_dict["slime_sprites"]
         self.interaction = sprite_dict["interaction"]
         self.soil_layer = sprite_dict["soil_layer"]
+        self.world = sprite_dict["world"]
 
     def use_tool(self):
         if self.selected_hand == 'hoe':
@@ -139,17 +145,15 @@ class Player(pygame.sprite.Sprite):
             self.player_stats["xp"] += PLAYER_LEVEL_STATS['dig']
 
         if self.selected_hand == 'axe':
-            for tree in self.tree_sprites.sprites():
-                if tree.rect.collidepoint(self.target_pos):
-                    tree.damage()
-                    if tree.health == 0:
-                        self.player_stats["xp"] += PLAYER_LEVEL_STATS['wood']
-                    self.player_stats["stamina"] -= PLAYER_STAMINA_STATS['tree']
-
-            for slime in self.slime_sprites.sprites():
-                slime.slime()
-                if slime.hitbox.collidepoint(self.target_pos):
-                    slime.damage()
+            for tree in self.world.at_point('trees', self.target_pos):
+                tree.damage()
+                if tree.health == 0:
+                    self.player_stats["xp"] += PLAYER_LEVEL_STATS['wood']
+                self.player_stats["stamina"] -= PLAYER_STAMINA_STATS['tree']
+
+            # slimes keep their hitbox up to date, see Slime.update
+            for slime in self.world.at_point('slimes', self.target_pos):
+                slime.damage()
 
         if self.selected_hand == 'water':
             self.soil_layer.water(self.target_pos)
@@ -158,10 +162,9 @@ class Player(pygame.sprite.Sprite):
             self.player_stats["stamina"] -= PLAYER_STAMINA_STATS['water']
 
         if self.selected_hand == 'fishing':
-            for water in self.water_sprites:
-                if water.rect.collidepoint(self.target_pos):
-                    self.throw_bob.play()
-                    self.fishing.fishing_start()
+            for water in self.world.at_point('water', self.target_pos):
+                self.throw_bob.play()
+                self.fishing.fishing_start()
 
     def get_target_pos(self):
         """
@@ -308,8 +311,8 @@ class Player(pygame.sprite.Sprite):
             # interaction with bed
             if keys[pygame.K_RETURN]:
                 # self.toggle_shop()
-                collided_interaction_sprites = pygame.sprite.spritecollide(
-                    self, self.interaction, False)
+                collided_interaction_sprites = self.world.in_rect(
+                    'interactions', self.rect)
                 if collided_interaction_sprites:
                     map_no = self.get_map_level()
                     if map_no == MAP_NUMBERS["Starting"]:
@@ -452,24 +455,26 @@ class Player(pygame.sprite.Sprite):
             timer.update()
 
     def collision(self, direction):
-        for sprite in self.collision_sprites.sprites():
-            if hasattr(sprite, 'hitbox'):
-                if sprite.hitbox.colliderect(self.hitbox):
-                    if direction == 'horizontal':
-                        if self.direction.x > 0:  # moving right
-                            self.hitbox.right = sprite.hitbox.left
-                        if self.direction.x < 0:  # moving left
-                            self.hitbox.left = sprite.hitbox.right
-                        self.rect.centerx = self.hitbox.centerx
-                        self.pos.x = self.hitbox.centerx
-
-                    if direction == 'vertical':
-                        if self.direction.y > 0:  # moving down
-                            self.hitbox.bottom = sprite.hitbox.top
-                        if self.direction.y < 0:  # moving up
-                            self.hitbox.top = sprite.hitbox.bottom
-                        self.rect.centery = self.hitbox.centery
-                        self.pos.y = self.hitbox.centery
+        # only the colliders around the player are looked at. The area is
+        # wider than the hitbox as being pushed back moves the hitbox
+        area = self.hitbox.inflate(self.hitbox.width, self.hitbox.height)
+        for sprite in self.collision_sprites.in_rect_ordered(area):
+            if sprite.hitbox.colliderect(self.hitbox):
+                if direction == 'horizontal':
+                    if self.direction.x > 0:  # moving right
+                        self.hitbox.right = sprite.hitbox.left
+                    if self.direction.x < 0:  # moving left
+                        self.hitbox.left = sprite.hitbox.right
+                    self.rect.centerx = self.hitbox.centerx
+                    self.pos.x = self.hitbox.centerx
+
+                if direction == 'vertical':
+                    if self.direction.y > 0:  # moving down
+                        self.hitbox.bottom = sprite.hitbox.top
+                    if self.direction.y < 0:  # moving up
+                        self.hitbox.top = sprite.hitbox.bottom
+                    self.rect.centery = self.hitbox.centery
+                    self.pos.y = self.hitbox.centery
 
     def move(self, dt):
 
@@ -500,40 +505,38 @@ class Player(pygame.sprite.Sprite):
 
     def auto_save_night(self):
         """
-        Autosave function for the player.
+        Restores the player for the night, the save itself is written by
+        the SaveSlot from save_data
         :return: NoneType
         """
         self.status = 'left_idle'
         self.player_stats["stamina"] = self.player_stats["max_stamina"]
         self.speed = 200
 
-        with open(path.join(CURR_PATH, 'data', 'player_info.json'), 'w') as f:
-            d = {"player stats": {"xp": self.player_stats["xp"],
-                                  "level": self.player_stats["level"],
-                                  "max_xp": self.player_stats["max_xp"],
-                                  "stamina": self.player_stats["stamina"],
-                                  "max_stamina": self.player_stats["max_stamina"],
-                                  "money": self.player_stats["money"]},
-                 "player items": {key: value for key, value in
-                                  self.item_inventory.items()},
-                 "player seeds": {key: value for key, value in
-                                  self.seed_inventory.items()}}
-
-            jason_file = json.dumps(d, indent=4)
-
-            f.write(jason_file)
-
-    @staticmethod
-    def read_save_file():
+    def save_data(self) -> dict:
         """
-        Function serves to read the save file of player
-        :return: NoneType
+        Copy of the player state to save, later changes to the player do not
+        touch it
+        :return: dict written to the save
         """
-        with open(path.join(CURR_PATH, 'data', 'player_info.json'), 'r') as f:
-            file_content = f.read()
-            d = json.loads(file_content)
-
-        return d
+        return {"player stats": {"xp": self.player_stats["xp"],
+                                 "level": self.player_stats["level"],
+                                 "max_xp": self.player_stats["max_xp"],
+                                 "stamina": self.player_stats["stamina"],
+                                 "max_stamina": self.player_stats["max_stamina"],
+                                 "money": self.player_stats["money"]},
+                "player items": {key: value for key, value in
+                                 self.item_inventory.items()},
+                "player seeds": {key: value for key, value in
+                                 self.seed_inventory.items()}}
+
+    @property
+    def save_version(self) -> tuple[int, int, int]:
+        """
+        :return: changes made to the stats, items and seeds so far
+        """
+        return (self.player_stats.version, self.item_inventory.version,
+                self.seed_inventory.version)
 
     def update(self, dt):
         if self.fishing.fishing_status:
@@ -0,0 +1,93 @@
+# Copyright (c) 2025 Your Name
+# Licensed under the AGPLv3 License. See LICENSE file for details.
+#
+# This project is based on a tutorial (link: https://www.youtube.com/watch?v=T4IX36sP_0c).
+# You can redistribute and/or modify it under the terms of the AGPLv3.
+#
+# This software comes with no warranty. See the LICENSE file for more information.
+
+import threading
+
+import pygame
+from game_code.settings import *
+from game_code.map_data import map_info
+from game_code.tmx_cache import load_map, preload_tilesets
+
+
+class MapPreloader:
+    """
+    Prepares a map on a worker thread before the player enters it: the
+    compiled TMX data, the tileset images and the ground tiles around the
+    entrance. The worker only decodes, converting surfaces for the display
+    is left to the main thread when the map is built. The caches it fills
+    are shared with the main thread, see cached_asset.
+    """
+
+    def __init__(self):
+        # level_no -> worker thread, a map is only preloaded once
+        self.threads = {}
+
+    def request(self, level_no: int):
+        """
+        Starts preloading a map, does nothing if it was already requested
+        :return: None
+        """
+        if level_no in self.threads:
+            return
+
+        thread = threading.Thread(target=self.prepare, args=(level_no,),
+                                  name=f'preload-map-{level_no}', daemon=True)
+        self.threads[level_no] = thread
+        thread.start()
+
+    def wait(self, level_no: int):
+        """
+        Called before building a map, so the main thread never races the
+        worker and reuses what it already decoded
+        :return: None
+        """
+        thread = self.threads.get(level_no)
+        if thread is not None:
+            thread.join()
+
+    @staticmethod
+    def prepare(level_no: int):
+        """
+        Runs on the worker thread
+        :return: None
+        """
+        try:
+            info = map_info(level_no)
+            tiled_map = load_map(info.tmx_path)
+            preload_tilesets(tiled_map)
+
+            for obj in tiled_map.get_layer_by_name('Player'):
+                if obj.name == 'Start':
+                    view = pygame.Rect(0, 0, SCREEN_WIDTH + GROUND_TILE_SIZE,
+                                       SCREEN_HEIGHT + GROUND_TILE_SIZE)
+                    view.center = (obj.x, obj.y)
+                    info.ground.preload(view)
+        except (OSError, ValueError, pygame.error) as e:
+            # the map is simply built without help when the player arrives
+            print(f"Could not preload map {level_no}: {e}")
+
+    def check_transitions(self, player_pos, interaction_sprites,
+                          resident_maps):
+        """
+        Requests the map behind every transition the player is close to.
+        Transition interactions are named after the map they lead to.
+        :param player_pos: centre of the player
+        :param interaction_sprites: interactions of the active map
+        :param resident_maps: maps which are already built
+        :return: None
+        """
+        for sprite in interaction_sprites:
+            level_no = MAP_NUMBERS.get(sprite.name)
+            if level_no is None or level_no in self.threads or \
+                    level_no in resident_maps:
+                continue
+
+            distance = pygame.math.Vector2(sprite.rect.center).distance_to(
+                player_pos)
+            if distance <= PRELOAD_RADIUS:
+                self.request(level_no)
@@ -0,0 +1,104 @@
+# Copyright (c) 2025 Your Name
+# Licensed under the AGPLv3 License. See LICENSE file for details.
+#
+# This project is based on a tutorial (link: https://www.youtube.com/watch?v=T4IX36sP_0c).
+# You can redistribute and/or modify it under the terms of the AGPLv3.
+#
+# This software comes with no warranty. See the LICENSE file for more information.
+
+from bisect import bisect_left, bisect_right
+
+import pygame
+
+
+class RenderLayers:
+    """
+    Keeps sprites bucketed by their z value, each bucket ordered by
+    rect.centery. Sprites are only moved inside their bucket when their z or
+    centery changed, so static tiles are sorted once when they are added and
+    never again.
+    """
+
+    def __init__(self):
+        # z -> sprites ordered by centery, and the matching centery keys
+        self.layers = {}
+        self.keys = {}
+        # z -> half of the tallest sprite, used to widen the y band on lookups
+        self.margins = {}
+        self.z_order = []
+        # sprite -> (z, centery) it is stored under
+        self.entries = {}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add(self, sprite: pygame.sprite.Sprite):
+        """
+        Inserts the sprite in its layer, after sprites with the same centery
+        :return: None
+        """
+        z, key = sprite.z, sprite.rect.centery
+        if z not in self.layers:
+            self.layers[z] = []
+            self.keys[z] = []
+            self.margins[z] = 0
+            self.z_order = sorted(self.layers)
+
+        keys = self.keys[z]
+        index = bisect_right(keys, key)
+        keys.insert(index, key)
+        self.layers[z].insert(index, sprite)
+        self.margins[z] = max(self.margins[z], sprite.rect.height // 2 + 1)
+        self.entries[sprite] = (z, key)
+
+    def remove(self, sprite: pygame.sprite.Sprite):
+        """
+        Removes the sprite if it is stored
+        :return: None
+        """
+        entry = self.entries.pop(sprite, None)
+        if entry is None:
+            return
+
+        z, key = entry
+        keys = self.keys[z]
+        sprites = self.layers[z]
+        index = bisect_left(keys, key)
+        while sprites[index] is not sprite:
+            index += 1
+        del keys[index]
+        del sprites[index]
+
+    def place(self, sprite: pygame.sprite.Sprite):
+        """
+        Adds the sprite, or re-sorts it if its z or centery changed
+        :return: None
+        """
+        entry = self.entries.get(sprite)
+        if entry is None:
+            self.add(sprite)
+        elif entry != (sprite.z, sprite.rect.centery):
+            self.remove(sprite)
+            self.add(sprite)
+
+    def ordered(self):
+        """
+        :return: every sprite in drawing order
+        """
+        for z in self.z_order:
+            yield from self.layers[z]
+
+    def ordered_in_band(self, top: int, bottom: int):
+        """
+        Only walks the part of each layer whose sprites can reach between
+        top and bottom, found by bisecting on centery.
+        :param top: top of the band in world coordinates
+        :param bottom: bottom of the band in world coordinates
+        :return: sprites in drawing order
+        """
+        for z in self.z_order:
+            keys = self.keys[z]
+            margin = self.margins[z]
+            start = bisect_left(keys, top - margin)
+            end = bisect_right(keys, bottom + margin)
+            yield from self.layers[z][start:end]
@@ -0,0 +1,182 @@
+# Copyright (c) 2025 Your Name
+# Licensed under the AGPLv3 License. See LICENSE file for details.
+#
+# This project is based on a tutorial (link: https://www.youtube.com/watch?v=T4IX36sP_0c).
+# You can redistribute and/or modify it under the terms of the AGPLv3.
+#
+# This software comes with no warranty. See the LICENSE file for more information.
+
+import json
+import os
+from os import path
+
+from game_code.settings import *
+from game_code.save_worker import SaveWorker
+
+
+def write_atomic(file_path: str, data: bytes):
+    """
+    Replaces a file through a temporary one, a crash leaves either the old
+    or the new content but never half of it
+    :return: None
+    """
+    temp_path = file_path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, file_path)
+
+
+class TrackedDict(dict):
+    """
+    dict counting its changes in version, so a save can tell whether it has
+    anything new to write. Storing the value a key already has is no change.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key, value):
+        if key not in self or self[key] != value:
+            super().__setitem__(key, value)
+            self.version += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.version += 1
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, *args):
+        had_key = args[0] in self
+        value = super().pop(*args)
+        self.version += had_key
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self.version += 1
+        return item
+
+    def clear(self):
+        self.version += bool(self)
+        super().clear()
+
+
+class SaveSlot:
+    """
+    The save of a game: the farm and the player, both kept by one soil
+    store. Both are taken in the same frame and handed to the SaveWorker as
+    one save, which the store commits at once (one sqlite transaction or one
+    snapshot file), so a crash leaves either the old or the new save of both
+    but never the farm of one save with the player of another. Parts which
+    did not change since the last save are left out.
+    """
+
+    def __init__(self, save_worker: SaveWorker, soil_store,
+                 player_path: str = path.join(CURR_PATH, 'data',
+                                              'player_info.json')):
+        """
+        :param save_worker: writes the saves
+        :param soil_store: SoilStore or SoilSnapshotStore the game is saved
+        to, see create_soil_store
+        :param player_path: player of a new game, or of a save made before
+        the player was kept by the soil store
+        """
+        self.save_worker = save_worker
+        self.soil_store = soil_store
+        self.player_path = player_path
+        # Player.save_version handed to the worker and not written yet
+        self.queued_version = None
+
+    def load_player(self) -> dict:
+        """
+        :return: the saved player
+        """
+        data = self.soil_store.load_player()
+        if data is None:
+            with open(self.player_path, 'rb') as f:
+                data = f.read()
+        return json.loads(data)
+
+    def save(self, soil_layer, player=None):
+        """
+        Snapshots the changed parts of the game and queues them
+        :param soil_layer: SoilLayer of the farm, a closed one is not saved
+        :param player: Player, None to only save the farm
+        :return: None
+        """
+        soil = None
+        if not soil_layer.closed:
+            soil = self.soil_store.snapshot(soil_layer.grid,
+                                            soil_layer.plants)
+
+        player_data, version = None, None
+        if player is not None:
+            version = player.save_version
+            if version not in (player.saved_version, self.queued_version):
+                player_data = player.save_data()
+                self.queued_version = version
+
+        if soil or player_data is not None:
+            self.save_worker.submit('game', (soil, player, player_data,
+                                             version),
+                                    self.write, self.merge)
+
+    def merge(self, pending: tuple, snapshot: tuple) -> tuple:
+        """
+        Combines a save still waiting, or one which failed, with a newer one
+        :return: the save to write
+        """
+        pending_soil, soil = pending[0], snapshot[0]
+        if pending_soil:
+            soil = self.soil_store.merge(pending_soil, soil) if soil \
+                else pending_soil
+        player_part = pending[1:] if snapshot[2] is None else snapshot[1:]
+        return (soil,) + player_part
+
+    def write(self, snapshot: tuple):
+        """
+        Runs on the save worker. The player only counts as saved once the
+        save is written, a failed write is queued again by the next save.
+        :return: None
+        """
+        soil, player, player_data, version = snapshot
+        record = None
+        if player_data is not None:
+            indent = None if COMPACT_PLAYER_SAVE else 4
+            separators = (',', ':') if COMPACT_PLAYER_SAVE else None
+            record = json.dumps(player_data, indent=indent,
+                                separators=separators).encode()
+        try:
+            self.soil_store.write(soil, record)
+        except Exception:
+            self.queued_version = None
+            raise
+        if player_data is not None:
+            player.saved_version = version
+
+    def flush(self):
+        """
+        Waits until every queued save is on disk
+        :return: None
+        """
+        self.save_worker.flush()
+
+    def close(self):
+        """
+        Writes what is still queued, stops the save worker and closes the
+        soil store
+        :return: None
+        """
+        self.save_worker.close()
+        self.soil_store.close()
@@ -0,0 +1,140 @@
+# Copyright (c) 2025 Your Name
+# Licensed under the AGPLv3 License. See LICENSE file for details.
+#
+# This project is based on a tutorial (link: https://www.youtube.com/watch?v=T4IX36sP_0c).
+# You can redistribute and/or modify it under the terms of the AGPLv3.
+#
+# This software comes with no warranty. See the LICENSE file for more information.
+
+import threading
+
+
+def keep_newest(pending, snapshot):
+    """
+    Default merge of SaveWorker.submit, a snapshot of the whole state
+    replaces the one still waiting
+    :return: the snapshot to write
+    """
+    return snapshot
+
+
+def merge_changes(pending: dict, snapshot: dict) -> dict:
+    """
+    Merge for snapshots holding only what changed, later changes of the same
+    key win
+    :return: the snapshot to write
+    """
+    pending.update(snapshot)
+    return pending
+
+
+class SaveWorker:
+    """
+    Writes the save files on a worker thread so the frame never waits on the
+    disk. The game hands over snapshots which are not touched anymore once
+    submitted. A save submitted while an older one of the same name still
+    waits is merged into it, so the disk only sees the latest state.
+    Snapshots are written in the order they were first submitted. A snapshot
+    which could not be written is kept and merged into the next save of the
+    same name, so what it held is written with it.
+    """
+
+    def __init__(self):
+        # name -> (write, snapshot, merge) of the saves waiting to be written
+        self.pending = {}
+        # name -> (write, snapshot, merge) of the saves whose write failed
+        self.failed = {}
+        self.writing = False
+        self.closed = False
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(target=self.run, name='save-worker',
+                                       daemon=True)
+        self.thread.start()
+
+    def submit(self, name: str, snapshot, write, merge=keep_newest):
+        """
+        Queues a snapshot to be written
+        :param name: what is saved, e.g. "soil"
+        :param snapshot: state to write, owned by the worker from now on
+        :param write: called with the snapshot on the worker thread
+        :param merge: combines an older snapshot of the same name, waiting or
+        failed, with this one
+        :return: None
+        """
+        with self.condition:
+            older = self.pending.get(name) or self.failed.pop(name, None)
+            if older is not None:
+                snapshot = merge(older[1], snapshot)
+            self.pending[name] = (write, snapshot, merge)
+            self.condition.notify_all()
+
+    def run(self):
+        """
+        Runs on the worker thread
+        :return: None
+        """
+        while True:
+            with self.condition:
+                while not self.pending and not self.closed:
+                    self.condition.wait()
+                if not self.pending:
+                    return
+                saves = list(self.pending.items())
+                self.pending.clear()
+                self.writing = True
+
+            try:
+                for name, (write, snapshot, merge) in saves:
+                    try:
+                        write(snapshot)
+                    except Exception as e:
+                        # the game keeps running, the save is tried again
+                        # with the next one of the same name
+                        print(f"Could not save {name}: {e}")
+                        self.keep_failed(name, write, snapshot, merge)
+            finally:
+                with self.condition:
+                    self.writing = False
+                    self.condition.notify_all()
+
+    def keep_failed(self, name: str, write, snapshot, merge,
+                    retry: bool = False):
+        """
+        Keeps a snapshot whose write failed, a newer save of the same name
+        already waiting takes it in right away
+        :param retry: queue it again even without a newer save
+        :return: None
+        """
+        with self.condition:
+            if name in self.pending:
+                newer_write, newer, _ = self.pending[name]
+                self.pending[name] = (newer_write, merge(snapshot, newer),
+                                      merge)
+            elif retry:
+                self.pending[name] = (write, snapshot, merge)
+            else:
+                self.failed[name] = (write, snapshot, merge)
+
+    def flush(self):
+        """
+        Waits until everything submitted so far was written or failed
+        :return: None
+        """
+        with self.condition:
+            while self.pending or self.writing:
+                self.condition.wait()
+
+    def close(self):
+        """
+        Tries the failed saves once more, writes what is still waiting and
+        stops the worker
+        :return: None
+        """
+        with self.condition:
+            failed = list(self.failed.items())
+            self.failed.clear()
+            for name, (write, snapshot, merge) in failed:
+                self.keep_failed(name, write, snapshot, merge, retry=True)
+            self.closed = True
+            self.condition.notify_all()
+        self.thread.join()
@@ -109,6 +109,61 @@ MAP_NUMBERS = {
     "Forest": 1,
 }
 
+# maps kept alive after the player left them, swapping back is instant
+MAX_RESIDENT_MAPS = 2
+# the map behind a transition starts loading when the player is this close
+PRELOAD_RADIUS = 8 * TILE_SIZE
+
+# grid name -> tile layer compiled into a one byte per tile grid
+TMX_GRID_LAYERS = {
+    'collision': 'Collision',
+    'cow collision': 'CowCollision',
+    'farmable': 'Farmable',
+}
+
+# map number -> (tmx file in data, ground image in graphics/world)
+MAP_FILES = {
+    MAP_NUMBERS["Starting"]: ('map.tmx', 'ground 2.png'),
+    MAP_NUMBERS["Forest"]: (os.path.join('Tilesets', 'Forest.tmx'),
+                            'Forest.png'),
+}
+
+# camera
+# only draw sprites touching the screen, looked up through a spatial hash
+CAMERA_CULLING = True
+# size in pixels of one cell of the spatial hashes
+SPATIAL_CELL_SIZE = 256
+# static tile layers are baked into squares of this size at map load
+STATIC_CHUNK_SIZE = 512
+# big world images are split into tiles of this size, decoded when drawn
+GROUND_TILE_SIZE = 512
+# memory the decoded ground tiles may use, in bytes
+GROUND_CACHE_BYTES = 32 * 1024 * 1024
+
+# sound
+# mixer channels shared by the sound effects
+SOUND_CHANNELS = 16
+# theme -> (file in audio, volume), streamed by the MusicManager
+MUSIC_TRACKS = {
+    'day': ('music.mp3', 0.3),
+    'night': ('nighttime.wav', 1),
+    'fishing': ('fishing theme.mp3', 1),
+    'forest': ('bg.mp3', 0.5),
+}
+# time taken to fade a theme out, and the next one in
+MUSIC_FADE_MS = 1000
+
+# soil
+# graphics/soil tile of a tilled tile, indexed by its tilled neighbours:
+# top | left << 1 | bottom << 2 | right << 3
+SOIL_TILE_TYPES = ['o', 'b', 'r', 'br', 't', 'tb', 'tr', 'tbl',
+                   'l', 'bl', 'lr', 'lrb', 'tl', 'tbr', 'lrt', 'x']
+# how the farm is saved, 'sqlite' writes the changed tiles as rows of
+# data/farming_data.db, 'snapshot' rewrites data/farming_data.soil at once
+SOIL_SAVE_BACKEND = 'sqlite'
+# the player is saved as JSON without indentation and spaces
+COMPACT_PLAYER_SAVE = False
+
 # plant settings
 PLANT_OFFSET = {
     'wheat': -16,
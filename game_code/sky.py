@@ -94,6 +94,7 @@ class Drop(Generic):
     """
     This class is used to simulate rain in the air
     """
+    dynamic = True
 
     def __init__(self, surf, pos, moving, groups, z):
 
@@ -125,14 +126,15 @@ class Rain:
     This class is used to simulate rain drops (on the ground)
     """
 
-    def __init__(self, all_sprites: pygame.sprite.Group):
+    def __init__(self, all_sprites: pygame.sprite.Group,
+                 bounds: pygame.Rect):
         self.all_sprites = all_sprites
         self.rain_drops = import_folder(path.join(CURR_PATH,
                                                   'graphics', 'rain', 'drops'))
         self.rain = import_folder(path.join(CURR_PATH, 'graphics', 'rain',
                                             'floor'))
-        self.floor_w, self.floor_h = pygame.image.load(path.join(
-            CURR_PATH, 'graphics', 'world', 'ground.png')).get_size()
+        # size of the map the rain falls on
+        self.floor_w, self.floor_h = bounds.size
 
     def create_floor(self):
         Drop(surf=choice(self.rain),
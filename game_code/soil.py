@@ -6,39 +6,26 @@
 #
 # This software comes with no warranty. See the LICENSE file for more information.
 
-from typing import Callable
 
 from game_code.settings import *
-from pytmx.util_pygame import load_pygame
+from game_code.tmx_cache import load_map
 from game_code.support import *
 from random import choice
 import json
 from pygame.math import Vector2
 from os import path
-import sqlite3
-
-
-class SoilTile(pygame.sprite.Sprite):
-
-    def __init__(self, pos, surf: pygame.surface,
-                 groups: list[pygame.sprite.Group]):
-        super().__init__(groups)
-        self.image = surf
-        self.rect = self.image.get_rect(topleft=pos)
-        self.z = LAYERS['soil']
-
-
-class WaterTile(pygame.sprite.Sprite):
-    def __init__(self, pos, surf: pygame.surface, groups: pygame.sprite.Group):
-        super().__init__(groups)
-        self.image = surf
-        self.rect = self.image.get_rect(topleft=pos)
-        self.z = LAYERS['soil water']
+from game_code.spatial import IndexedGroup, SpatialHash, reindex
+from game_code.map_data import map_info
+from game_code.sound import load_sound
+from game_code.soil_grid import SoilGrid, FARMABLE, TILLED, WATERED, PLANTED
+from game_code.chunks import TileOverlay
+from game_code.plant_store import PlantStore
+from game_code.save_slot import SaveSlot
 
 
 class Plant(pygame.sprite.Sprite):
     def __init__(self, plant_type, groups: list[pygame.sprite.Group],
-                 soil, check_watered: Callable, age):
+                 soil: pygame.Rect, store: PlantStore, age):
         super().__init__(groups)
 
         # setup
@@ -47,21 +34,28 @@ class Plant(pygame.sprite.Sprite):
                                               plant_type)
                                     )
         self.soil = soil
-        self.check_watered = check_watered
 
-        # plant growth
-        self.age = 0 if age is None else age
+        # plant growth, the age is kept by the store and grown by SoilLayer
+        self.store = store
         self.max_age = len(self.frames) - 1
-        self.grow_speed = GROW_SPEED[plant_type]
-        self.harvestable = False
+        self.slot = store.add(self, (soil.x // TILE_SIZE, soil.y // TILE_SIZE),
+                              0 if age is None else age, self.max_age)
 
         # sprite setup
-        self.image = self.frames[self.age]
+        self.image = self.frames[int(self.age)]
         self.y_offset = PLANT_OFFSET[self.plant_type]
-        self.rect = self.image.get_rect(midbottom=soil.rect.midbottom +
+        self.rect = self.image.get_rect(midbottom=soil.midbottom +
                                                   Vector2(0, self.y_offset))
         self.z = LAYERS['ground plant']
 
+    @property
+    def age(self) -> float:
+        return self.store.current_age(self.slot)
+
+    @property
+    def harvestable(self) -> bool:
+        return bool(self.store.harvestable[self.slot])
+
     def __str__(self):
         return f'{self.plant_type},{self.age},' \
                f'{self.rect.left},{self.rect.top}'
@@ -70,50 +64,56 @@ class Plant(pygame.sprite.Sprite):
         return {
             "plant_type": self.plant_type,
             "age": self.age,
-            "left": self.rect.left,
-            "top": self.rect.top
+            "left": self.soil.left,
+            "top": self.soil.top
         }
 
-    def grow(self):
-        if self.check_watered(self.rect.center):
-            self.age += self.grow_speed
-
-            if int(self.age) > 0:
-                self.z = LAYERS['main']
-                self.hitbox = self.rect.copy().inflate(-26,
-                                                       -self.rect.height * 0.4)
-
-            if self.age >= self.max_age:
-                self.age = self.max_age
-                self.harvestable = True
-
-            self.image = self.frames[int(self.age)]
-            if self.age > 2:
-                self.rect = self.image.get_rect(midbottom=
-                                                self.soil.rect.midbottom +
-                                                Vector2
-                                                (0, self.y_offset))
-            else:
-                self.rect = self.image.get_rect(midbottom=
-                                                self.soil.rect.midbottom +
-                                                Vector2
-                                                (0, self.y_offset +
-                                                 BIG_PLANT_OFFSET
-                                                 [self.plant_type]))
+    def redraw(self):
+        """
+        Updates the sprite after the plant grew to another stage
+        :return: None
+        """
+        age = self.age
+        self.image = self.frames[int(age)]
+        if age > 2:
+            self.rect = self.image.get_rect(midbottom=
+                                            self.soil.midbottom +
+                                            Vector2
+                                            (0, self.y_offset))
+        else:
+            self.rect = self.image.get_rect(midbottom=
+                                            self.soil.midbottom +
+                                            Vector2
+                                            (0, self.y_offset +
+                                             BIG_PLANT_OFFSET
+                                             [self.plant_type]))
+
+        if int(age) > 0:
+            self.z = LAYERS['main']
+            self.hitbox = self.rect.copy().inflate(-26,
+                                                   -self.rect.height * 0.4)
+        reindex(self)
 
 
 # noinspection PyCompatibility
 class SoilLayer:
-    grid: list[list[str]]
+    grid: SoilGrid
 
     def __init__(self, all_sprites: pygame.sprite.Group,
-                 collision_sprites: pygame.sprite.Group):
+                 collision_sprites: pygame.sprite.Group,
+                 save_slot: SaveSlot):
         # sprite groups
         self.all_sprites = all_sprites
         self.collision_sprites = collision_sprites
-        self.soil_sprites = pygame.sprite.Group()
-        self.water_sprites = pygame.sprite.Group()
-        self.plant_sprites = pygame.sprite.Group()
+        # tilled and wet tiles, drawn in chunks redrawn when a tile changes
+        self.soil_overlay = TileOverlay(all_sprites, LAYERS['soil'])
+        self.water_overlay = TileOverlay(all_sprites, LAYERS['soil water'])
+        self.plant_sprites = IndexedGroup()
+        # (column, row) -> Plant of every planted tile
+        self.plants = {}
+        # harvestable plants by the tiles they cover, the only plants the
+        # player is checked against every frame
+        self.harvestable_plants = SpatialHash(TILE_SIZE)
 
         # graphics
         self.soil_surfs = import_folder_dict(path.join(CURR_PATH, 'graphics',
@@ -122,183 +122,132 @@ class SoilLayer:
                                                    'soil_water'))
 
         self.create_soil_grid()
+        # ages of the plants, grown every night by update_plants
+        self.plant_store = PlantStore(self.grid)
         self.create_hit_rects()
 
         # bools
         self.raining = False
 
         # sounds
-        self.hoe_sound = pygame.mixer.Sound(path.join(CURR_PATH, 'audio',
-                                                      'hoe.wav'))
-        self.hoe_sound.set_volume(0.1)
-        self.plant_sound = pygame.mixer.Sound(path.join(CURR_PATH, 'audio',
-                                                        'plant.wav'))
-        self.plant_sound.set_volume(0.2)
-
-        # read saved data
+        self.hoe_sound = load_sound(path.join(CURR_PATH, 'audio', 'hoe.wav'),
+                                    0.1)
+        self.plant_sound = load_sound(path.join(CURR_PATH, 'audio',
+                                                'plant.wav'), 0.2)
+
+        # read saved data, only changed tiles are written back
+        self.save_slot = save_slot
+        self.soil_store = save_slot.soil_store
+        # set once the farm left the map cache, see close
+        self.closed = False
         self.read_soil_state()
 
     def create_soil_grid(self):
-        ground = pygame.image.load(path.join(CURR_PATH, 'graphics',
-                                             'world', 'ground 2.png')
-                                   ).convert_alpha()
-        h_tiles = ground.get_width() // TILE_SIZE
-        v_tiles = ground.get_height() // TILE_SIZE
-
-        self.grid = [[[] for col in range(h_tiles)] for row in range(v_tiles)]
-        for x, y, _ in load_pygame(path.join(CURR_PATH, 'data',
-                                             'map.tmx')).get_layer_by_name(
-            'Farmable').tiles():
-            self.grid[y][x].append('F')
-        # for row in self.grid:
-        #     print(row)
+        farm = map_info(MAP_NUMBERS["Starting"])
+        h_tiles = farm.bounds.width // TILE_SIZE
+        v_tiles = farm.bounds.height // TILE_SIZE
+
+        self.grid = SoilGrid(h_tiles, v_tiles)
+        for x, y in load_map(farm.tmx_path).grid_cells('farmable'):
+            self.grid.set(x, y, FARMABLE)
 
     def create_hit_rects(self):
-        self.hit_rects = []
-        for index_row, row in enumerate(self.grid):
-            for index_col, cell in enumerate(row):
-                if 'F' in cell:
-                    x = index_col * TILE_SIZE
-                    y = index_row * TILE_SIZE
-                    rect = pygame.Rect(x, y, TILE_SIZE, TILE_SIZE)
-                    self.hit_rects.append(rect)
+        # (column, row) -> rect of the tiles the hoe can hit
+        self.hit_rects = {}
+        for index_col, index_row in self.grid.tiles_with(FARMABLE):
+            x = index_col * TILE_SIZE
+            y = index_row * TILE_SIZE
+            rect = pygame.Rect(x, y, TILE_SIZE, TILE_SIZE)
+            self.hit_rects[(index_col, index_row)] = rect
 
     def save_soil_state(self):
         """
-        Function written to save state of soil tiles
+        Function written to save state of soil tiles, only the tiles changed
+        since the last save are written, by the save worker
         :return: NoneType
         """
-        conn = sqlite3.connect(path.join(CURR_PATH, 'data', 'farming_data.db'))
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM farmableData')
-        cursor.execute('DELETE FROM plantedData')
-        cursor.execute('DELETE FROM plantData')
-
-        for i, row in enumerate(self.grid):
-            ln = ""
-            for j, cell in enumerate(row):
-                mini_ln = ""
-                for item in cell:
-                    
-                    if item == 'F':
-                        cursor.execute(
-                            'INSERT INTO farmableData VALUES (?, ?)',
-                            (i, j)
-                        )
-                    elif item == 'X':
-
-                        print("Found tilled tiles.")
-                        cursor.execute(
-                            'INSERT INTO plantedData VALUES (?, ?)',
-                            (i, j)
-                        )
-
-        for plant in self.plant_sprites:
-            plant_data = plant.plant_info()
-            curson.execute(
-                'INSERT INTO soilData VALUES (?, ?, ?, ?)',
-                (
-                    plant_data['plant_data'],
-                    plant_data['age'],
-                    plant_data['left'],
-                    plant_data['top']
-                )
-            )
-        conn.commit()
-        conn.close()
+        self.save_slot.save(self)
+
+    def close(self):
+        """
+        Saves the farm, the layer is not saved anymore afterwards. A farm
+        built again reads the store.
+        :return: None
+        """
+        self.save_soil_state()
+        self.save_slot.flush()
+        self.closed = True
 
     def read_soil_state(self):
         """
-        Function written to read save state of soil tiles
+        Function written to read save state of soil tiles, a closed layer
+        keeps its state
         :return: NoneType
         """
-        conn = sqlite3.connect(path.join(CURR_PATH, 'data', 'farming_data.db'))
-        cursor = conn.cursor()
-
-        for i in range(len(self.grid)):
-            for j in range(len(self.grid[i])):
-                self.grid[i][j] = []  # Clear existing cell content
-        
-        # Read farmable tiles (F)
-        cursor.execute('SELECT i, j FROM farmableData')
-        for i, j in cursor.fetchall():
-            self.grid[i][j].append('F')
-        
-        # Read planted tiles (X)
-        cursor.execute('SELECT i, j FROM plantedData')
-        for i, j in cursor.fetchall():
-            self.grid[i][j].append('X')
-        
+        if self.closed:
+            return
+
+        # saves still being written are read back
+        self.save_slot.flush()
+
+        # plants of the current state are replaced by the saved ones
+        for plant in self.plants.values():
+            self.harvestable_plants.remove(plant)
+            self.plant_store.remove(plant.slot)
+            plant.kill()
+        self.plants.clear()
+
+        saved_plants = self.soil_store.load(self.grid)
         self.create_soil_tiles()
 
-        cursor.execute('SELECT plant_type, age, left, top FROM plantData')
-        for selected_seed, age, left, top in cursor.fetchall():
-            selected_seed = item[0]
-            target_pos = (left + TILE_SIZE // 2, top + TILE_SIZE // 2)
-            self.plant_seed(target_pos, selected_seed, age)
+        for selected_seed, age, x, y in saved_plants:
+            if self.grid.has(x, y, TILLED):
+                self.add_plant(x, y, selected_seed, age)
 
-        conn.close()
         if self.raining:
             self.remove_water()
             self.water_all()
 
     def get_hit(self, point):
-        for rect in self.hit_rects:
-            if rect.collidepoint(point):
-                self.hoe_sound.play()
-                x = rect.x // TILE_SIZE
-                y = rect.y // TILE_SIZE
-
-                if 'F' in self.grid[y][x]:
-                    self.grid[y][x].append('X')
-                    self.create_soil_tiles()
-                    if self.raining:
-                        self.water(point)
+        x, y = self.grid.tile_at(point)
+        if (x, y) in self.hit_rects:
+            self.hoe_sound.play()
 
-    def water(self, target_pos):
-        for soil_sprite in self.soil_sprites:
-            if soil_sprite.rect.collidepoint(target_pos):
-                # add tree to soil grid
-                x = soil_sprite.rect.x // TILE_SIZE
-                y = soil_sprite.rect.y // TILE_SIZE
-                pos = soil_sprite.rect.topleft
+            if self.grid.has(x, y, FARMABLE):
+                self.grid.set(x, y, TILLED)
+                self.soil_store.mark(x, y)
+                self.update_soil_tiles(x, y)
+                if self.raining:
+                    self.water(point)
 
-                if self.check_watered(pos):
-                    self.grid[y][x].append('W')
+    def water(self, target_pos):
+        x, y = self.grid.tile_at(target_pos)
+        if self.grid.has(x, y, TILLED):
+            # add water to soil grid
+            self.grid.set(x, y, WATERED)
 
-                # water sprite
-                surf = choice(self.water_surfs)
-                WaterTile(pos, surf, [self.all_sprites, self.water_sprites])
+            # water tile, a wet tile keeps the look it already has
+            surf = choice(self.water_surfs)
+            if (x, y) not in self.water_overlay:
+                self.water_overlay.set_tile(x, y, surf)
 
     def water_all(self):
-        for index_row, row in enumerate(self.grid):
-            for index_col, cell in enumerate(row):
-                if 'X' in cell and 'W' not in cell:
-                    cell.append('W')
-
-                    x = index_col * TILE_SIZE
-                    y = index_row * TILE_SIZE
-                    surf = choice(self.water_surfs)
-                    WaterTile((x, y), surf,
-                              [self.all_sprites, self.water_sprites])
+        dry_tiles = list(self.grid.tiles_with(TILLED, without=WATERED))
+        self.grid.set_all(WATERED, where=TILLED)
+        for index_col, index_row in dry_tiles:
+            self.water_overlay.set_tile(index_col, index_row,
+                                        choice(self.water_surfs))
 
     def remove_water(self):
 
-        # destroy all water sprites
-        for sprite in self.water_sprites.sprites():
-            sprite.kill()
+        # dry every tile
+        self.water_overlay.clear()
         # clean grid
-        for row in self.grid:
-            for cell in row:
-                if 'W' in cell:
-                    cell.remove('W')
+        self.grid.clear_all(WATERED)
 
     def check_watered(self, pos):
-        x = pos[0] // TILE_SIZE
-        y = pos[1] // TILE_SIZE
-        cell = self.grid[y][x]
-        is_watered = 'W' in cell
-        return is_watered
+        x, y = self.grid.tile_at(pos)
+        return self.grid.has(x, y, WATERED)
 
     def plant_seed(self, target_pos, selected_seed: str, age: int = None):
         """
@@ -308,93 +257,111 @@ class SoilLayer:
         :param age: int indicating age of plant
         :return: boolean indicating success or fail in planting
         """
-        for soil_sprite in self.soil_sprites:
-            if soil_sprite.rect.collidepoint(target_pos):
-                self.plant_sound.play()
+        x, y = self.grid.tile_at(target_pos)
+        if not self.grid.has(x, y, TILLED):
+            return False
 
-                x = soil_sprite.rect.x // TILE_SIZE
-                y = soil_sprite.rect.y // TILE_SIZE
+        self.plant_sound.play()
+        if self.grid.has(x, y, PLANTED):
+            return False
 
-                if 'P' not in self.grid[y][x]:
-                    self.grid[y][x].append('P')
-                    Plant(selected_seed,
-                          [self.all_sprites, self.plant_sprites,
-                           self.collision_sprites], soil_sprite,
-                          self.check_watered, age)
-                    return True
+        self.add_plant(x, y, selected_seed, age)
+        self.soil_store.mark(x, y)
+        return True
 
-        return False
+    def add_plant(self, x: int, y: int, selected_seed: str, age=None):
+        """
+        Creates the plant of a tilled tile
+        :param x: column of the tile
+        :param y: row of the tile
+        :return: None
+        """
+        self.grid.set(x, y, PLANTED)
+        self.plants[(x, y)] = Plant(
+            selected_seed,
+            [self.all_sprites, self.plant_sprites, self.collision_sprites],
+            pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE),
+            self.plant_store, age)
+
+        # saved plants are drawn as grown as they are
+        plant = self.plants[(x, y)]
+        if age:
+            plant.redraw()
+        if plant.harvestable:
+            self.add_harvestable(plant)
+
+    def add_harvestable(self, plant: Plant):
+        """
+        Called once a plant is fully grown
+        :return: None
+        """
+        self.harvestable_plants.insert(plant, plant.rect)
+
+    def harvestable_in(self, rect: pygame.Rect) -> list[Plant]:
+        """
+        :param rect: area in world coordinates, e.g. the player hitbox
+        :return: harvestable plants overlapping the area, in planting order
+        """
+        return sorted(self.harvestable_plants.query(rect),
+                      key=self.plant_sprites.add_order.__getitem__)
+
+    def harvest(self, plant: Plant):
+        """
+        Removes a plant and frees its soil tile for planting
+        :return: None
+        """
+        self.harvestable_plants.remove(plant)
+        self.plant_store.remove(plant.slot)
+        plant.kill()
+
+        x = plant.soil.x // TILE_SIZE
+        y = plant.soil.y // TILE_SIZE
+        self.grid.clear(x, y, PLANTED)
+        del self.plants[(x, y)]
+        self.soil_store.mark(x, y)
 
     def update_plants(self):
         """
-        Grows the plants, originally used for night cycle
+        Grows the plants, originally used for night cycle. Only the plants
+        which reached another stage have their sprite updated, and only the
+        ones whose growth event was due are saved again. The saved age of
+        the others is the one of their last event, so a farm loaded from the
+        save never loses a stage the player saw.
         :return: None
         """
-        for plant in self.plant_sprites.sprites():
-            plant.grow()
+        aged, redraw, ripened = self.plant_store.grow()
+        for slot in aged:
+            soil = self.plant_store.plants[slot].soil
+            self.soil_store.mark(soil.x // TILE_SIZE, soil.y // TILE_SIZE)
+        for slot in redraw:
+            self.plant_store.plants[slot].redraw()
+        for slot in ripened:
+            self.add_harvestable(self.plant_store.plants[slot])
 
     def create_soil_tiles(self):
         """
-        Sets the tile of soil based on what other soil tiles there are beside it
+        Sets the tile of soil based on what other soil tiles there are beside
+        it, for the whole farm at once
         :return: None
         """
-        self.soil_sprites.empty()
-        for index_row, row in enumerate(self.grid):
-            for index_col, cell in enumerate(row):
-                if 'X' in cell:
-
-                    # tile options
-                    t = 'X' in self.grid[index_row - 1][index_col]
-                    b = 'X' in self.grid[index_row + 1][index_col]
-                    r = 'X' in row[index_col + 1]
-                    l = 'X' in row[index_col - 1]
-
-                    tile_type = 'o'
-
-                    # switch case rather than if statement (added 27-05-2023)
-                    match (t, l, b, r):
-                        # all sides
-                        case (True, True, True, True):
-                            tile_type = 'x'
-
-                        # horizontal tiles only
-                        case (False, True, False, False):
-                            tile_type = 'r'
-
-                        case (False, False, False, True):
-                            tile_type = 'l'
-
-                        case (False, True, False, True):
-                            tile_type = 'lr'
-
-                        # vertical tiles only
-                        case (True, False, False, False):
-                            tile_type = 'b'
-                        case (False, False, True, False):
-                            tile_type = 't'
-                        case (True, False, True, False):
-                            tile_type = 'tb'
-
-                        # corners
-                        case (False, True, True, False):
-                            tile_type = 'tr'
-                        case (False, False, True, True):
-                            tile_type = 'tl'
-                        case (True, True, False, False):
-                            tile_type = 'br'
-                        case (True, False, False, True):
-                            tile_type = 'bl'
-
-                        # T shapes
-                        case (True, False, True, True):
-                            tile_type = 'tbr'
-                        case (True, True, True, False):
-                            tile_type = 'tbl'
-                        case (True, True, False, True):
-                            tile_type = 'lrb'
-                        case (False, True, True, True):
-                            tile_type = 'lrt'
-
-                    SoilTile(pos=(index_col * TILE_SIZE, index_row * TILE_SIZE),
-                             surf=self.soil_surfs[tile_type],
-                             groups=[self.all_sprites, self.soil_sprites])
+        self.soil_overlay.clear()
+        for x, y, mask in self.grid.neighbour_masks(TILLED):
+            self.soil_overlay.set_tile(x, y,
+                                       self.soil_surfs[SOIL_TILE_TYPES[mask]])
+
+    def update_soil_tiles(self, x: int, y: int):
+        """
+        Retiles a tile whose state changed along with its four neighbours,
+        the only tiles whose look depends on it
+        :param x: column of the tile
+        :param y: row of the tile
+        :return: None
+        """
+        for tile_x, tile_y in ((x, y), (x, y - 1), (x - 1, y), (x, y + 1),
+                               (x + 1, y)):
+            if self.grid.has(tile_x, tile_y, TILLED):
+                mask = self.grid.neighbour_mask(tile_x, tile_y, TILLED)
+                self.soil_overlay.set_tile(
+                    tile_x, tile_y, self.soil_surfs[SOIL_TILE_TYPES[mask]])
+            else:
+                self.soil_overlay.remove_tile(tile_x, tile_y)
@@ -0,0 +1,139 @@
+# Copyright (c) 2025 Your Name
+# Licensed under the AGPLv3 License. See LICENSE file for details.
+#
+# This project is based on a tutorial (link: https://www.youtube.com/watch?v=T4IX36sP_0c).
+# You can redistribute and/or modify it under the terms of the AGPLv3.
+#
+# This software comes with no warranty. See the LICENSE file for more information.
+
+from game_code.settings import *
+
+# flags of a soil tile, several can be set at once
+FARMABLE = 1  # 'F', the hoe can till it
+TILLED = 2  # 'X'
+WATERED = 4  # 'W'
+PLANTED = 8  # 'P'
+
+
+class SoilGrid:
+    """
+    State of every farm tile as one byte of flags, in a bytearray stored
+    row by row. Tiles off the grid read as having no flag set.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.cells = bytearray(width * height)
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    @staticmethod
+    def tile_at(pos) -> tuple[int, int]:
+        """
+        :param pos: point in world coordinates
+        :return: column and row of the tile containing the point
+        """
+        return int(pos[0] // TILE_SIZE), int(pos[1] // TILE_SIZE)
+
+    def get(self, x: int, y: int) -> int:
+        """
+        :return: every flag of the tile
+        """
+        if self.in_bounds(x, y):
+            return self.cells[y * self.width + x]
+        return 0
+
+    def has(self, x: int, y: int, flag: int) -> bool:
+        """
+        :param flag: e.g. TILLED, or several flags or-ed together
+        :return: True if every given flag is set on the tile
+        """
+        return self.get(x, y) & flag == flag
+
+    def set(self, x: int, y: int, flag: int):
+        """
+        Sets flags on a tile, tiles off the grid are ignored
+        :return: None
+        """
+        if self.in_bounds(x, y):
+            self.cells[y * self.width + x] |= flag
+
+    def clear(self, x: int, y: int, flag: int):
+        """
+        Clears flags of a tile, tiles off the grid are ignored
+        :return: None
+        """
+        if self.in_bounds(x, y):
+            self.cells[y * self.width + x] &= ~flag & 0xFF
+
+    def clear_all(self, flag: int):
+        """
+        Clears flags on every tile at once
+        :return: None
+        """
+        self.cells = self.cells.translate(
+            bytes(value & ~flag & 0xFF for value in range(256)))
+
+    def set_all(self, flag: int, where: int = 0):
+        """
+        Sets flags on every tile at once
+        :param flag: flags to set
+        :param where: only tiles with these flags are changed
+        :return: None
+        """
+        self.cells = self.cells.translate(
+            bytes(value | flag if value & where == where else value
+                  for value in range(256)))
+
+    def reset(self):
+        """
+        Clears every flag of every tile
+        :return: None
+        """
+        self.cells = bytearray(self.width * self.height)
+
+    def tiles_with(self, flag: int, without: int = 0):
+        """
+        :param flag: flags the tiles must have
+        :param without: flags the tiles must not have
+        :return: column and row of every matching tile, row by row
+        """
+        marked = self.cells.translate(
+            bytes(1 if value & flag == flag and not value & without else 0
+                  for value in range(256)))
+        index = marked.find(1)
+        while index != -1:
+            yield index % self.width, index // self.width
+            index = marked.find(1, index + 1)
+
+    def neighbour_mask(self, x: int, y: int, flag: int) -> int:
+        """
+        :return: which of the four neighbours of the tile have the flag,
+        top | left << 1 | bottom << 2 | right << 3
+        """
+        return (self.has(x, y - 1, flag) | self.has(x - 1, y, flag) << 1 |
+                self.has(x, y + 1, flag) << 2 | self.has(x + 1, y, flag) << 3)
+
+    def neighbour_masks(self, flag: int):
+        """
+        neighbour_mask of every tile with the flag, computed in one pass
+        over a copy of the grid padded by an empty tile on every side
+        :return: column, row and mask of every tile with the flag
+        """
+        width = self.width + 2
+        marked = self.cells.translate(
+            bytes(1 if value & flag == flag else 0 for value in range(256)))
+        padded = bytearray(width * (self.height + 2))
+        for y in range(self.height):
+            start = (y + 1) * width + 1
+            padded[start:start + self.width] = \
+                marked[y * self.width:(y + 1) * self.width]
+
+        index = padded.find(1)
+        while index != -1:
+            yield (index % width - 1, index // width - 1,
+                   padded[index - width] | padded[index - 1] << 1 |
+                   padded[index + width] << 2 | padded[index + 1] << 3)
+            index = padded.find(1, index + 1)
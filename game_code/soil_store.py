@@ -0,0 +1,367 @@
+# Copyright (c) 2025 Your Name
+# Licensed under the AGPLv3 License. See LICENSE file for details.
+#
+# This project is based on a tutorial (link: https://www.youtube.com/watch?v=T4IX36sP_0c).
+# You can redistribute and/or modify it under the terms of the AGPLv3.
+#
+# This software comes with no warranty. See the LICENSE file for more information.
+
+import mmap
+import sqlite3
+import struct
+import threading
+import zlib
+from os import path
+
+from game_code.settings import *
+from game_code.soil_grid import SoilGrid, FARMABLE, TILLED
+from game_code.plant_store import PLANT_TYPES, PLANT_TYPE_IDS
+from game_code.save_worker import keep_newest, merge_changes
+from game_code.save_slot import write_atomic
+
+# rows are i and columns j in the database, plants are keyed by the top left
+# corner of their soil tile
+CREATE_TABLES = '''
+CREATE TABLE IF NOT EXISTS farmableData (
+    i INTEGER NOT NULL,
+    j INTEGER NOT NULL,
+    PRIMARY KEY (i, j)
+);
+CREATE TABLE IF NOT EXISTS plantedData (
+    i INTEGER NOT NULL,
+    j INTEGER NOT NULL,
+    PRIMARY KEY (i, j),
+    FOREIGN KEY (i, j) REFERENCES farmData(i, j)
+);
+CREATE TABLE IF NOT EXISTS plantData (
+    plant_type  CHAR(50) NOT NULL,
+    age         INTEGER NOT NULL,
+    left        INTEGER NOT NULL,
+    top         INTEGER NOT NULL,
+    PRIMARY KEY (left, top)
+);
+CREATE TABLE IF NOT EXISTS playerData (
+    id   INTEGER PRIMARY KEY,
+    data BLOB NOT NULL
+);
+'''
+
+INSERT_FARMABLE = 'INSERT OR IGNORE INTO farmableData VALUES (?, ?)'
+DELETE_FARMABLE = 'DELETE FROM farmableData WHERE i = ? AND j = ?'
+INSERT_TILLED = 'INSERT OR IGNORE INTO plantedData VALUES (?, ?)'
+DELETE_TILLED = 'DELETE FROM plantedData WHERE i = ? AND j = ?'
+UPSERT_PLANT = 'INSERT OR REPLACE INTO plantData VALUES (?, ?, ?, ?)'
+DELETE_PLANT = 'DELETE FROM plantData WHERE left = ? AND top = ?'
+# the save holds a single player, kept in row 0
+UPSERT_PLAYER = 'INSERT OR REPLACE INTO playerData VALUES (0, ?)'
+
+# snapshot file: header, the soil flags zlib compressed, one record per plant,
+# then the player record up to the end of the file. The version is bumped
+# whenever the layout or PLANT_TYPES change.
+SNAPSHOT_MAGIC = b'SOIL'
+SNAPSHOT_VERSION = 1
+# magic, version, grid width, grid height, compressed flags size, plants
+SNAPSHOT_HEADER = struct.Struct('<4sHHHII')
+# plant type id, age, column, row
+SNAPSHOT_PLANT = struct.Struct('<BdHH')
+# flags kept in a save, the others only last a day
+SAVED_FLAGS = FARMABLE | TILLED
+
+
+class SoilStore:
+    """
+    Saves the farm and the player to the sqlite database. The connection
+    stays open for the whole game, so sqlite keeps the statements below
+    prepared, and the database runs in WAL mode so a save only appends to
+    the log.
+
+    The soil layer marks every tile whose state changed, a save then only
+    writes the rows of those tiles and the player record if it changed, all
+    in one transaction. Snapshots of the marked tiles are taken on the main
+    thread and can be written from the SaveWorker.
+    """
+    # combines snapshots waiting in the SaveWorker
+    merge = staticmethod(merge_changes)
+
+    def __init__(self, database: str = path.join(CURR_PATH, 'data',
+                                                 'farming_data.db')):
+        # used by the main thread to load and by the save worker to write
+        self.conn = sqlite3.connect(database, check_same_thread=False)
+        self.lock = threading.Lock()
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(CREATE_TABLES)
+        # (column, row) of the tiles changed since the last save
+        self.dirty_tiles = set()
+        self.closed = False
+
+    def mark(self, x: int, y: int):
+        """
+        Marks a tile whose flags or plant changed, it is written on the next
+        save
+        :return: None
+        """
+        self.dirty_tiles.add((x, y))
+
+    def load(self, grid: SoilGrid) -> list[tuple[str, float, int, int]]:
+        """
+        Sets the saved FARMABLE and TILLED flags on the grid, every other
+        flag is cleared. Without saved farmable tiles the ones of the grid
+        are kept and written on the next save.
+        :return: plant type, age, column and row of every saved plant
+        """
+        self.dirty_tiles.clear()
+        with self.lock:
+            farmable = self.conn.execute(
+                'SELECT i, j FROM farmableData').fetchall()
+            tilled = self.conn.execute(
+                'SELECT i, j FROM plantedData').fetchall()
+            plants = self.conn.execute(
+                'SELECT plant_type, age, left, top FROM plantData').fetchall()
+
+        if farmable:
+            grid.reset()
+            for i, j in farmable:
+                grid.set(j, i, FARMABLE)
+        else:
+            grid.clear_all(~FARMABLE & 0xFF)
+            self.dirty_tiles.update(grid.tiles_with(FARMABLE))
+        for i, j in tilled:
+            grid.set(j, i, TILLED)
+
+        return [(plant_type, age, left // TILE_SIZE, top // TILE_SIZE)
+                for plant_type, age, left, top in plants]
+
+    def load_player(self):
+        """
+        :return: saved player record, None if the database has none
+        """
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT data FROM playerData WHERE id = 0').fetchone()
+        return None if row is None else bytes(row[0])
+
+    def snapshot(self, grid: SoilGrid, plants: dict) -> dict:
+        """
+        Takes the state of the marked tiles and unmarks them, if writing
+        the snapshot fails the SaveWorker merges it into the next save
+        :param grid: soil grid of the farm
+        :param plants: (column, row) -> Plant of every planted tile
+        :return: (column, row) -> farmable, tilled and the plant row or None
+        of every marked tile, empty if no tile changed
+        """
+        changes = {}
+        if self.closed:
+            self.dirty_tiles.clear()
+        for x, y in self.dirty_tiles:
+            flags = grid.get(x, y)
+            plant = plants.get((x, y))
+            if plant is not None:
+                plant = (plant.plant_type, plant.age, plant.soil.left,
+                         plant.soil.top)
+            changes[(x, y)] = (bool(flags & FARMABLE), bool(flags & TILLED),
+                               plant)
+        self.dirty_tiles.clear()
+        return changes
+
+    def write(self, changes: dict, player: bytes = None):
+        """
+        Writes a snapshot and the player in one transaction
+        :param changes: returned by snapshot, may be merged from several,
+        None if no tile is written
+        :param player: player record, None if it did not change
+        :return: None
+        """
+        rows = {statement: [] for statement in
+                (INSERT_FARMABLE, DELETE_FARMABLE, INSERT_TILLED,
+                 DELETE_TILLED, UPSERT_PLANT, DELETE_PLANT, UPSERT_PLAYER)}
+        for (x, y), (farmable, tilled, plant) in (changes or {}).items():
+            rows[INSERT_FARMABLE if farmable else
+                 DELETE_FARMABLE].append((y, x))
+            rows[INSERT_TILLED if tilled else DELETE_TILLED].append((y, x))
+            if plant is not None:
+                rows[UPSERT_PLANT].append(plant)
+            else:
+                rows[DELETE_PLANT].append((x * TILE_SIZE, y * TILE_SIZE))
+        if player is not None:
+            rows[UPSERT_PLAYER].append((player,))
+
+        # the connection commits on success and rolls back on an error
+        with self.lock, self.conn:
+            for statement, statement_rows in rows.items():
+                if statement_rows:
+                    self.conn.executemany(statement, statement_rows)
+
+    def close(self):
+        """
+        Closes the connection, unsaved changes are lost and later snapshots
+        are empty
+        :return: None
+        """
+        self.closed = True
+        with self.lock:
+            self.conn.close()
+
+
+class SoilSnapshotStore:
+    """
+    Saves the farm and the player as one file: a header, the saved flags of
+    the whole soil grid as a compressed blob, the plants as packed records
+    and the player record. Loading is a single memory mapped read, saving
+    rewrites the file through a temporary one so a crash never leaves half a
+    save behind. Tiles are still marked like for SoilStore, a save without
+    changes is skipped. The part of the file which did not change in a save
+    is kept from the last one.
+    """
+    # a snapshot holds the whole farm, the newest one replaces older ones
+    merge = staticmethod(keep_newest)
+
+    def __init__(self, snapshot_path: str = path.join(CURR_PATH, 'data',
+                                                      'farming_data.soil')):
+        self.path = snapshot_path
+        # (column, row) of the tiles changed since the last save
+        self.dirty_tiles = set()
+        self.closed = False
+        # farm and player part of the file, read on load and replaced by
+        # every write
+        self.farm = None
+        self.player = None
+
+    def mark(self, x: int, y: int):
+        """
+        Marks a tile whose flags or plant changed, the farm is written on the
+        next save
+        :return: None
+        """
+        self.dirty_tiles.add((x, y))
+
+    def read(self):
+        """
+        :return: farm and player part of the file, None without a valid save
+        """
+        try:
+            with open(self.path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                magic, version, _, _, size, count = \
+                    SNAPSHOT_HEADER.unpack_from(data)
+                if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+                    print(f"Ignoring soil snapshot {self.path}, it was saved "
+                          f"by another version")
+                    return None
+
+                end = SNAPSHOT_HEADER.size + size + \
+                    count * SNAPSHOT_PLANT.size
+                if end > len(data):
+                    raise ValueError("the file is truncated")
+                return data[:end], data[end:]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, struct.error) as e:
+            print(f"Could not read soil snapshot {self.path}: {e}")
+            return None
+
+    @staticmethod
+    def unpack_farm(farm: bytes, grid: SoilGrid):
+        """
+        :param farm: farm part of the file
+        :param grid: soil grid the farm is loaded into
+        :return: saved flags and plant records
+        """
+        _, _, width, height, size, _ = SNAPSHOT_HEADER.unpack_from(farm)
+        if (width, height) != (grid.width, grid.height):
+            raise ValueError("it was saved for another map size")
+        start = SNAPSHOT_HEADER.size
+        cells = zlib.decompress(farm[start:start + size])
+        return cells, list(SNAPSHOT_PLANT.iter_unpack(farm[start + size:]))
+
+    def load(self, grid: SoilGrid) -> list[tuple[str, float, int, int]]:
+        """
+        Sets the saved flags on the grid, every other flag is cleared.
+        Without a save the FARMABLE tiles of the grid are kept and written on
+        the next save.
+        :return: plant type, age, column and row of every saved plant
+        """
+        self.dirty_tiles.clear()
+        self.farm = None
+        saved = self.read()
+        if saved is not None:
+            try:
+                cells, plants = self.unpack_farm(saved[0], grid)
+                self.farm = saved[0]
+            except (ValueError, zlib.error) as e:
+                print(f"Ignoring soil snapshot {self.path}: {e}")
+
+        if self.farm is None:
+            grid.clear_all(~FARMABLE & 0xFF)
+            self.dirty_tiles.update(grid.tiles_with(FARMABLE))
+            return []
+
+        grid.cells = bytearray(cells)
+        return [(PLANT_TYPES[type_id], age, x, y)
+                for type_id, age, x, y in plants]
+
+    def load_player(self):
+        """
+        :return: saved player record, None if the file has none
+        """
+        saved = self.read()
+        self.player = saved[1] if saved is not None and saved[1] else None
+        return self.player
+
+    def snapshot(self, grid: SoilGrid, plants: dict) -> bytes:
+        """
+        Packs the whole farm, unmarks every tile. If writing the snapshot
+        fails the SaveWorker keeps it until a newer one replaces it.
+        :param grid: soil grid of the farm
+        :param plants: (column, row) -> Plant of every planted tile
+        :return: content of the snapshot file, empty if no tile changed
+        """
+        if not self.dirty_tiles or self.closed:
+            self.dirty_tiles.clear()
+            return b''
+        self.dirty_tiles.clear()
+
+        cells = zlib.compress(grid.cells.translate(
+            bytes(value & SAVED_FLAGS for value in range(256))))
+        records = b''.join(
+            SNAPSHOT_PLANT.pack(PLANT_TYPE_IDS[plant.plant_type], plant.age,
+                                x, y)
+            for (x, y), plant in plants.items())
+        return SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION,
+                                    grid.width, grid.height, len(cells),
+                                    len(plants)) + cells + records
+
+    def write(self, snapshot: bytes, player: bytes = None):
+        """
+        Replaces the snapshot file, the part not given is kept
+        :param snapshot: returned by snapshot, empty or None if no tile
+        changed
+        :param player: player record, None if it did not change
+        :return: None
+        """
+        farm = snapshot or self.farm
+        if farm is None:
+            raise ValueError("the farm was never saved")
+        if player is None:
+            player = self.player
+        write_atomic(self.path, farm + (player or b''))
+        self.farm, self.player = farm, player
+
+    def close(self):
+        """
+        Nothing stays open between saves, later snapshots are empty
+        :return: None
+        """
+        self.closed = True
+
+
+def create_soil_store(backend: str = SOIL_SAVE_BACKEND):
+    """
+    :param backend: 'sqlite' or 'snapshot', see SOIL_SAVE_BACKEND
+    :return: the store saving the farm
+    """
+    if backend == 'snapshot':
+        return SoilSnapshotStore()
+    if backend == 'sqlite':
+        return SoilStore()
+    raise ValueError(f"Unknown soil save backend: {backend}")
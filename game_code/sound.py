@@ -0,0 +1,104 @@
+# Copyright (c) 2025 Your Name
+# Licensed under the AGPLv3 License. See LICENSE file for details.
+#
+# This project is based on a tutorial (link: https://www.youtube.com/watch?v=T4IX36sP_0c).
+# You can redistribute and/or modify it under the terms of the AGPLv3.
+#
+# This software comes with no warranty. See the LICENSE file for more information.
+
+import pygame
+from game_code.settings import *
+from game_code.support import asset_key
+
+
+class SoundHandle:
+    """
+    Plays a shared sound with its own volume. The volume is applied to the
+    channel the sound is played on, so the decoded sound itself is never
+    changed and can be shared by every tree, slime, etc.
+    """
+
+    def __init__(self, sound: pygame.mixer.Sound, volume: float = 1.0):
+        self.sound = sound
+        self.volume = volume
+        self.channel = None
+
+    def set_volume(self, volume: float):
+        """
+        :param volume: between 0 and 1, also changes the sound if it is playing
+        :return: None
+        """
+        self.volume = volume
+        if self.is_playing():
+            self.channel.set_volume(volume)
+
+    def get_volume(self) -> float:
+        return self.volume
+
+    def is_playing(self) -> bool:
+        return self.channel is not None and \
+            self.channel.get_sound() is self.sound
+
+    def play(self, loops: int = 0, maxtime: int = 0, fade_ms: int = 0):
+        """
+        Plays the sound on a free channel, like pygame.mixer.Sound.play
+        nothing is played when every channel is busy
+        :return: the channel used, None if none was free
+        """
+        channel = pygame.mixer.find_channel()
+        if channel is None:
+            return None
+
+        channel.play(self.sound, loops, maxtime, fade_ms)
+        channel.set_volume(self.volume)
+        self.channel = channel
+        return channel
+
+    def stop(self):
+        """
+        Stops the sound if it is still playing from this handle
+        :return: None
+        """
+        if self.is_playing():
+            self.channel.stop()
+        self.channel = None
+
+
+class SoundBank:
+    """
+    Decodes every sound file once and hands out handles sharing it
+    """
+
+    def __init__(self):
+        # normalized path -> decoded sound
+        self.sounds = {}
+        self.channels_set = False
+
+    def load(self, sound_path: str) -> pygame.mixer.Sound:
+        """
+        :param sound_path: path to the sound file
+        :return: the shared decoded sound
+        """
+        if not self.channels_set:
+            pygame.mixer.set_num_channels(SOUND_CHANNELS)
+            self.channels_set = True
+
+        key = asset_key(sound_path)
+        if key not in self.sounds:
+            self.sounds[key] = pygame.mixer.Sound(sound_path)
+        return self.sounds[key]
+
+    def handle(self, sound_path: str, volume: float = 1.0) -> SoundHandle:
+        return SoundHandle(self.load(sound_path), volume)
+
+
+sound_bank = SoundBank()
+
+
+def load_sound(sound_path: str, volume: float = 1.0) -> SoundHandle:
+    """
+    :param sound_path: path to the sound file
+    :param volume: volume of this handle, between 0 and 1
+    :return: a handle playing the sound decoded by the shared sound bank
+    """
+    return sound_bank.handle(sound_path, volume)
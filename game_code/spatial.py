@@ -0,0 +1,240 @@
+# Copyright (c) 2025 Your Name
+# Licensed under the AGPLv3 License. See LICENSE file for details.
+#
+# This project is based on a tutorial (link: https://www.youtube.com/watch?v=T4IX36sP_0c).
+# You can redistribute and/or modify it under the terms of the AGPLv3.
+#
+# This software comes with no warranty. See the LICENSE file for more information.
+
+from itertools import count
+
+import pygame
+from game_code.settings import *
+
+
+class SpatialHash:
+    """
+    Uniform grid that buckets items by the cells their rect overlaps, so that
+    rect and point queries only look at the few cells they touch instead of
+    every item in the world.
+    """
+
+    def __init__(self, cell_size: int = SPATIAL_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        # item -> (copy of the rect it was indexed with, cell range)
+        self.items = {}
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item):
+        return item in self.items
+
+    def cell_range(self, rect: pygame.Rect) -> tuple[int, int, int, int]:
+        """
+        :param rect: rect in world coordinates
+        :return: first and last cell column and row covered by the rect
+        """
+        size = self.cell_size
+        return (rect.left // size, rect.top // size,
+                max(rect.right - 1, rect.left) // size,
+                max(rect.bottom - 1, rect.top) // size)
+
+    def insert(self, item, rect: pygame.Rect):
+        """
+        Adds an item, or re-buckets it if it is already in the hash
+        :param item: hashable object to be indexed
+        :param rect: area covered by the item
+        :return: None
+        """
+        if item in self.items:
+            self.remove(item)
+
+        cells = self.cell_range(rect)
+        left, top, right, bottom = cells
+        for cell_x in range(left, right + 1):
+            for cell_y in range(top, bottom + 1):
+                self.cells.setdefault((cell_x, cell_y), set()).add(item)
+        self.items[item] = (pygame.Rect(rect), cells)
+
+    def remove(self, item):
+        """
+        Removes an item if it is in the hash
+        :return: None
+        """
+        entry = self.items.pop(item, None)
+        if entry is None:
+            return
+
+        left, top, right, bottom = entry[1]
+        for cell_x in range(left, right + 1):
+            for cell_y in range(top, bottom + 1):
+                bucket = self.cells.get((cell_x, cell_y))
+                if bucket is not None:
+                    bucket.discard(item)
+                    if not bucket:
+                        del self.cells[(cell_x, cell_y)]
+
+    def move(self, item, rect: pygame.Rect):
+        """
+        Updates the rect of an item, only touching the buckets when the item
+        crossed into other cells
+        :return: None
+        """
+        entry = self.items.get(item)
+        if entry is not None and entry[1] == self.cell_range(rect):
+            entry[0].update(rect)
+        else:
+            self.insert(item, rect)
+
+    def rect_of(self, item):
+        """
+        :return: the rect the item was last indexed with, None if missing
+        """
+        entry = self.items.get(item)
+        return entry[0] if entry else None
+
+    def query(self, rect: pygame.Rect) -> set:
+        """
+        :param rect: area in world coordinates
+        :return: set of items whose rect overlaps the area
+        """
+        left, top, right, bottom = self.cell_range(rect)
+        found = set()
+        for cell_x in range(left, right + 1):
+            for cell_y in range(top, bottom + 1):
+                bucket = self.cells.get((cell_x, cell_y))
+                if bucket:
+                    found.update(bucket)
+
+        return {item for item in found
+                if self.items[item][0].colliderect(rect)}
+
+    def query_point(self, point) -> set:
+        """
+        :param point: x and y in world coordinates
+        :return: set of items whose rect contains the point
+        """
+        x, y = int(point[0]), int(point[1])
+        bucket = self.cells.get((x // self.cell_size, y // self.cell_size))
+        if not bucket:
+            return set()
+
+        return {item for item in bucket
+                if self.items[item][0].collidepoint(x, y)}
+
+
+class IndexedGroup(pygame.sprite.Group):
+    """
+    Sprite group that keeps its sprites in a spatial hash.
+    Sprites are indexed lazily on the first query after being added, as most
+    of them join their groups before setting their rect. Sprites with a truthy
+    ``dynamic`` attribute (player, mobs, rain) are re-bucketed before each
+    query, every other sprite is assumed to stay put unless ``reindex`` is
+    called for it.
+    """
+
+    def __init__(self, *sprites, rect_attr: str = 'rect',
+                 cell_size: int = SPATIAL_CELL_SIZE):
+        self.rect_attr = rect_attr
+        self.index = SpatialHash(cell_size)
+        self.dynamic_sprites = set()
+        # kept in insertion order so ties sort like the original group
+        self.pending_sprites = {}
+        # sprite -> when it was added, to return query results in group order
+        self.add_order = {}
+        self.add_counter = count()
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        if getattr(sprite, 'dynamic', False):
+            self.dynamic_sprites.add(sprite)
+        self.pending_sprites[sprite] = None
+        self.add_order[sprite] = next(self.add_counter)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.dynamic_sprites.discard(sprite)
+        self.pending_sprites.pop(sprite, None)
+        self.add_order.pop(sprite, None)
+        self.index.remove(sprite)
+
+    def index_sprite(self, sprite):
+        """
+        Puts the sprite in the hash using its current rect, sprites that do
+        not have the rect attribute yet (e.g. seedlings without a hitbox) are
+        left out until they are reindexed.
+        :return: None
+        """
+        rect = getattr(sprite, self.rect_attr, None)
+        if rect is None:
+            self.index.remove(sprite)
+        else:
+            self.index.insert(sprite, rect)
+
+    def reindex(self, sprite):
+        """
+        Call after changing the rect of a sprite outside its update method
+        :return: None
+        """
+        if self.has_internal(sprite):
+            self.index_sprite(sprite)
+
+    def sync(self):
+        """
+        Indexes newly added sprites and re-buckets dynamic sprites whose rect
+        changed since the last query
+        :return: None
+        """
+        if self.pending_sprites:
+            for sprite in self.pending_sprites:
+                self.index_sprite(sprite)
+            self.pending_sprites.clear()
+
+        for sprite in self.dynamic_sprites:
+            rect = getattr(sprite, self.rect_attr, None)
+            if rect is None:
+                self.index.remove(sprite)
+            elif rect != self.index.rect_of(sprite):
+                self.index.move(sprite, rect)
+
+    def in_rect(self, rect: pygame.Rect) -> set:
+        """
+        :return: set of sprites overlapping the rect
+        """
+        self.sync()
+        return self.index.query(rect)
+
+    def in_rect_ordered(self, rect: pygame.Rect) -> list:
+        """
+        :return: sprites overlapping the rect, in the order they were added
+        to the group like iterating the group would
+        """
+        return sorted(self.in_rect(rect), key=self.add_order.__getitem__)
+
+    def at_point(self, point) -> set:
+        """
+        :return: set of sprites containing the point
+        """
+        self.sync()
+        return self.index.query_point(point)
+
+    def at_point_ordered(self, point) -> list:
+        """
+        :return: sprites containing the point, in the order they were added
+        """
+        return sorted(self.at_point(point), key=self.add_order.__getitem__)
+
+
+def reindex(sprite: pygame.sprite.Sprite):
+    """
+    Updates every indexed group the sprite is in, used by sprites which change
+    their rect outside of their update (trees being chopped, plants growing).
+    :param sprite: sprite whose rect or hitbox changed
+    :return: None
+    """
+    for group in sprite.groups():
+        if isinstance(group, IndexedGroup):
+            group.reindex(sprite)
@@ -10,6 +10,9 @@ import pygame
 from game_code.settings import *
 from random import randint, choice
 from os import path
+from game_code.spatial import reindex
+from game_code.support import load_image
+from game_code.sound import load_sound
 
 class Generic(pygame.sprite.Sprite):
 
@@ -79,6 +82,9 @@ class Tree(Generic):
 
     def __init__(self, pos, surf, groups, name, player_add):
         super().__init__(pos, surf, groups)
+        # fruit and particles are drawn by the first group (all sprites).
+        # self.groups() is a set, so its order can't be relied on
+        self.all_sprites = groups[0]
 
         # tree attributes
         self.health = 5
@@ -87,15 +93,12 @@ class Tree(Generic):
             stump_path = path.join(CURR_PATH, 'graphics', 'stumps', 'small.png')
         else:
             stump_path = path.join(CURR_PATH, 'graphics', 'stumps', 'large.png')
-        self.stump_surf = pygame.image.load(stump_path).convert_alpha()
+        self.stump_surf = load_image(stump_path)
 
         # apples
         self.fruit_type = choice(["apple", "orange", "pear", "peach"])
-        self.apple_surf = pygame.image.load(path.join(CURR_PATH,
-                                                      'graphics',
-                                                      'fruit',
-                                            f'{self.fruit_type}.png')
-                                            ).convert_alpha()
+        self.apple_surf = load_image(path.join(CURR_PATH, 'graphics', 'fruit',
+                                               f'{self.fruit_type}.png'))
         self.apple_pos = APPLE_POS[name]
         self.apple_sprites = pygame.sprite.Group()
         self.create_fruit()
@@ -104,8 +107,7 @@ class Tree(Generic):
         self.death_timer = None
 
         # sounds
-        self.axe_sound = pygame.mixer.Sound(path.join(CURR_PATH, 'audio',
-                                                      'axe.mp3'))
+        self.axe_sound = load_sound(path.join(CURR_PATH, 'audio', 'axe.mp3'))
 
         # og_info
         self.og_image = self.image
@@ -125,7 +127,7 @@ class Tree(Generic):
             Particle(
                 pos=random_apple.rect.topleft,
                 surf=random_apple.image,
-                groups=self.groups()[0],
+                groups=self.all_sprites,
                 z=LAYERS['fruit'])
             self.player_add(self.fruit_type)
             random_apple.kill()
@@ -139,7 +141,7 @@ class Tree(Generic):
                 Generic(
                     pos=(x, y),
                     surf=self.apple_surf,
-                    groups=[self.apple_sprites, self.groups()[0]],
+                    groups=[self.apple_sprites, self.all_sprites],
                     z=LAYERS['fruit'])
 
     def check_death(self):
@@ -147,7 +149,7 @@ class Tree(Generic):
             Particle(
                 pos=self.rect.topleft,
                 surf=self.image,
-                groups=self.groups()[0],
+                groups=self.all_sprites,
                 z=LAYERS['fruit'], duration=300)
             self.image = self.stump_surf
             self.rect = self.image.get_rect(midbottom=self.rect.midbottom)
@@ -155,6 +157,7 @@ class Tree(Generic):
             self.alive = False
             self.player_add('wood')
             self.death_timer = 2
+            reindex(self)
 
     def update(self, dt):
         if self.alive:
@@ -169,5 +172,6 @@ class Tree(Generic):
             self.hitbox = self.og_hitbox
             self.rect = self.og_rect
             self.death_timer = None
+            reindex(self)
         else:
             self.death_timer -= 1
@@ -6,12 +6,89 @@
 #
 # This software comes with no warranty. See the LICENSE file for more information.
 
+import threading
 from os import walk, path
 from os import name as os_name
 import pygame
 
+# normalized path -> converted surface or folder contents, shared by every
+# sprite using them. Surfaces handed out here must not be drawn on.
+_image_cache = {}
+_folder_cache = {}
+
+# the shared asset caches (these ones, the tileset loaders, the map infos
+# and the ground tiles) are filled by the MapPreloader from its worker thread
+# while the main thread keeps using them. The lock is only held to check and
+# publish an entry, never while a file is decoded, parsed or written.
+asset_lock = threading.Lock()
+# (id of the cache, key) -> Event set once the thread loading it is done
+_loading = {}
+
+
+def cached_asset(cache: dict, key, load):
+    """
+    Returns the cached entry, loading it on a miss. Hits never take the lock.
+    A miss is loaded outside the lock by the first thread asking for it,
+    another thread asking for the same key meanwhile waits for that load
+    instead of repeating it, every other key stays available.
+    :param cache: dict the entry is kept in
+    :param key: key of the entry
+    :param load: called without arguments to create the entry
+    :return: the cached entry
+    """
+    while True:
+        value = cache.get(key)
+        if value is not None:
+            return value
+
+        with asset_lock:
+            value = cache.get(key)
+            if value is not None:
+                return value
+            loading = _loading.get((id(cache), key))
+            if loading is None:
+                loading = _loading[(id(cache), key)] = threading.Event()
+                break
+        # loaded by the other thread, tried again here if that load failed
+        loading.wait()
+
+    try:
+        value = load()
+        with asset_lock:
+            cache[key] = value
+        return value
+    finally:
+        with asset_lock:
+            del _loading[(id(cache), key)]
+        loading.set()
+
+
+def asset_key(asset_path: str) -> str:
+    """
+    :param asset_path: relative or absolute path of an asset
+    :return: the key the asset is cached under
+    """
+    return path.normcase(path.abspath(asset_path))
+
+
+def load_image(image_path: str) -> pygame.Surface:
+    """
+    Loads and converts an image the first time it is asked for, later calls
+    return the same surface
+    :param image_path: path to the image
+    :return: shared converted surface
+    """
+    return cached_asset(
+        _image_cache, asset_key(image_path),
+        lambda: pygame.image.load(image_path).convert_alpha())
+
 
 def import_folder(input_path):
+    return list(cached_asset(_folder_cache, ('list', asset_key(input_path)),
+                             lambda: _import_folder(input_path)))
+
+
+def _import_folder(input_path):
     # surface_list = []
     paths_list = []
 
@@ -36,21 +113,23 @@ def import_folder(input_path):
     # print(paths_list)
     # print('------')
 
-    surface_list = [
-        pygame.image.load(item).convert_alpha() for item in paths_list
-    ]
+    surface_list = [load_image(item) for item in paths_list]
 
     return surface_list
 
 
 def import_folder_dict(input_path):
+    return dict(cached_asset(_folder_cache, ('dict', asset_key(input_path)),
+                             lambda: _import_folder_dict(input_path)))
+
+
+def _import_folder_dict(input_path):
     surface_dict = {}
 
     for _, __, img_files in walk(input_path):
         for image in img_files:
             full_path = path.join(input_path, image)
-            image_surf = pygame.image.load(full_path).convert_alpha()
-            surface_dict[image.split('.')[0]] = image_surf
+            surface_dict[image.split('.')[0]] = load_image(full_path)
 
     return surface_dict
 
@@ -68,8 +147,7 @@ def import_folder_dict2(input_path):
                 full_path = path.join(input_path, actual_path, image)
             else:
                 full_path = path.join(actual_path, image)
-            image_surf = pygame.image.load(full_path).convert_alpha()
-            imgs_lst.append(image_surf)
+            imgs_lst.append(load_image(full_path))
         if not files:
             # second .split is a fix for linux (ubuntu)
             surface_dict[actual_path.split('/')[-1]] = imgs_lst
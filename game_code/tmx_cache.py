@@ -0,0 +1,301 @@
+# Copyright (c) 2025 Your Name
+# Licensed under the AGPLv3 License. See LICENSE file for details.
+#
+# This project is based on a tutorial (link: https://www.youtube.com/watch?v=T4IX36sP_0c).
+# You can redistribute and/or modify it under the terms of the AGPLv3.
+#
+# This software comes with no warranty. See the LICENSE file for more information.
+
+import pickle
+import zlib
+from array import array
+from xml.etree import ElementTree
+
+import pygame
+import pytmx
+from pytmx.util_pygame import pygame_image_loader
+from game_code.settings import *
+from game_code.support import asset_lock, cached_asset
+from os import path
+
+# first bytes of a compiled map file, bumped when the format changes
+CACHE_MAGIC = b'PDMAP\x01'
+
+
+def file_stamp(file_path: str) -> list[int]:
+    stat = os.stat(file_path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def tileset_sources(tmx_path: str) -> list[str]:
+    """
+    :return: paths of the external .tsx tilesets used by the map
+    """
+    tmx_dir = path.dirname(tmx_path)
+    return [path.normpath(path.join(tmx_dir, tileset.attrib['source']))
+            for tileset in ElementTree.parse(tmx_path).getroot()
+            .iter('tileset') if 'source' in tileset.attrib]
+
+
+def compile_map(tmx_path: str) -> dict:
+    """
+    Parses a map with pytmx without loading any image. The loader passed to
+    pytmx only records which part of which file every gid comes from, so the
+    images can be cut out later, when they are actually used.
+    :param tmx_path: path to the .tmx file
+    :return: the compiled map, made of builtin types only
+    """
+    image_refs = []
+
+    def image_loader(filename, colorkey, **kwargs):
+        def load(rect=None, flags=None):
+            image_refs.append((path.normpath(filename), colorkey,
+                               tuple(rect) if rect else None,
+                               tuple(flags) if flags else None))
+            # gids are given the index + 1 of their reference
+            return len(image_refs)
+
+        return load
+
+    tiled_map = pytmx.TiledMap(tmx_path, image_loader=image_loader)
+    images = [image_refs[token - 1] if token else None
+              for token in tiled_map.images]
+
+    layers = []
+    for layer in tiled_map.layers:
+        if isinstance(layer, pytmx.TiledTileLayer):
+            layers.append({
+                "name": layer.name, "kind": "tiles",
+                "width": layer.width, "height": layer.height,
+                "data": array('I', (gid for row in layer.data
+                                    for gid in row)).tobytes()})
+        elif isinstance(layer, pytmx.TiledObjectGroup):
+            layers.append({
+                "name": layer.name, "kind": "objects",
+                "objects": [{"name": obj.name,
+                             "type": getattr(obj, 'type', None),
+                             "x": obj.x, "y": obj.y,
+                             "width": obj.width, "height": obj.height,
+                             "gid": obj.gid,
+                             "properties": dict(obj.properties)}
+                            for obj in layer]})
+
+    # layers read as booleans by the game, one byte per tile
+    grids = {}
+    for grid_name, layer_name in TMX_GRID_LAYERS.items():
+        for layer in layers:
+            if layer["kind"] == "tiles" and layer["name"] == layer_name:
+                grids[grid_name] = bytes(1 if gid else 0 for gid in
+                                         array('I', layer["data"]))
+
+    sources = [tmx_path] + tileset_sources(tmx_path) + \
+        sorted({ref[0] for ref in image_refs})
+    return {"sources": [[source, file_stamp(source)] for source in sources],
+            "width": tiled_map.width, "height": tiled_map.height,
+            "tilewidth": tiled_map.tilewidth,
+            "tileheight": tiled_map.tileheight,
+            "images": images, "layers": layers, "grids": grids}
+
+
+def is_current(compiled: dict) -> bool:
+    """
+    :return: False if any file the map was compiled from changed
+    """
+    try:
+        return all(file_stamp(source) == stamp
+                   for source, stamp in compiled["sources"])
+    except OSError:
+        return False
+
+
+def cache_path(tmx_path: str) -> str:
+    name = path.splitext(path.basename(tmx_path))[0]
+    return path.join(CURR_PATH, 'data', 'cache', 'maps', f'{name}.tmxc')
+
+
+def read_cache(file_path: str):
+    """
+    :return: the compiled map stored in the file, None if it can't be used
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        if not data.startswith(CACHE_MAGIC):
+            return None
+        return pickle.loads(zlib.decompress(data[len(CACHE_MAGIC):]))
+    except (OSError, zlib.error, pickle.UnpicklingError, EOFError):
+        return None
+
+
+def write_cache(file_path: str, compiled: dict):
+    """
+    Writes the compiled map, the game still runs if the cache is not writable
+    :return: None
+    """
+    try:
+        os.makedirs(path.dirname(file_path), exist_ok=True)
+        with open(file_path, 'wb') as f:
+            f.write(CACHE_MAGIC + zlib.compress(
+                pickle.dumps(compiled, pickle.HIGHEST_PROTOCOL)))
+    except OSError as e:
+        print(f"Could not write the map cache {file_path}: {e}")
+
+
+# (image path, colorkey) -> pytmx loader, tileset images are decoded once
+_tileset_loaders = {}
+# tmx path -> CompiledMap, reused while its sources don't change
+_loaded_maps = {}
+
+
+def tile_image(image_ref) -> pygame.Surface:
+    """
+    :param image_ref: (file, colorkey, rect, flags) recorded by compile_map
+    :return: the image cut and converted like load_pygame would
+    """
+    filename, colorkey, rect, flags = image_ref
+    loader = cached_asset(_tileset_loaders, (filename, colorkey),
+                          lambda: pygame_image_loader(filename, colorkey))
+    return loader(rect, pytmx.TileFlags(*flags) if flags else None)
+
+
+def preload_tilesets(tiled_map):
+    """
+    Decodes the tileset images used by a map. Nothing is converted, so it
+    can run on a worker thread.
+    :param tiled_map: CompiledMap
+    :return: None
+    """
+    for image_ref in tiled_map.image_refs:
+        if image_ref:
+            filename, colorkey = image_ref[:2]
+            cached_asset(_tileset_loaders, (filename, colorkey),
+                         lambda: pygame_image_loader(filename, colorkey))
+
+
+def load_map(tmx_path: str):
+    """
+    Loads a map from its compiled cache, pytmx only parses the map again
+    when the map, its tilesets or their images changed.
+    :param tmx_path: path to the .tmx file
+    :return: CompiledMap, used like a pytmx TiledMap
+    """
+    loaded = _loaded_maps.get(tmx_path)
+    if loaded is not None:
+        if is_current(loaded.compiled):
+            return loaded
+        with asset_lock:
+            if _loaded_maps.get(tmx_path) is loaded:
+                del _loaded_maps[tmx_path]
+
+    def load():
+        compiled = read_cache(cache_path(tmx_path))
+        if compiled is None or not is_current(compiled):
+            compiled = compile_map(tmx_path)
+            write_cache(cache_path(tmx_path), compiled)
+        return CompiledMap(compiled)
+
+    return cached_asset(_loaded_maps, tmx_path, load)
+
+
+class CompiledMap:
+    """
+    Map loaded from the compiled cache, it offers the part of the pytmx
+    TiledMap interface the game uses. Tile images are only cut out of their
+    tileset the first time they are asked for.
+    """
+
+    def __init__(self, compiled: dict):
+        self.compiled = compiled
+        self.width = compiled["width"]
+        self.height = compiled["height"]
+        self.tilewidth = compiled["tilewidth"]
+        self.tileheight = compiled["tileheight"]
+        self.grids = compiled["grids"]
+        self.image_refs = compiled["images"]
+        self.images = {}
+
+        self.layers = [CompiledTileLayer(self, layer)
+                       if layer["kind"] == "tiles"
+                       else CompiledObjectGroup(self, layer)
+                       for layer in compiled["layers"]]
+        self.layernames = {layer.name: layer for layer in self.layers}
+
+    def get_layer_by_name(self, name: str):
+        try:
+            return self.layernames[name]
+        except KeyError:
+            raise ValueError(f"Layer '{name}' not found.")
+
+    def get_tile_image_by_gid(self, gid: int):
+        """
+        :return: image of the gid, None for empty tiles
+        """
+        if gid not in self.images:
+            image_ref = self.image_refs[gid] if gid < len(self.image_refs) \
+                else None
+            self.images[gid] = tile_image(image_ref) if image_ref else None
+        return self.images[gid]
+
+    def grid_cells(self, grid_name: str):
+        """
+        :param grid_name: key of TMX_GRID_LAYERS
+        :return: x and y of every tile set in the grid
+        """
+        grid = self.grids.get(grid_name, b'')
+        for index, value in enumerate(grid):
+            if value:
+                yield index % self.width, index // self.width
+
+
+class CompiledTileLayer:
+    def __init__(self, parent: CompiledMap, layer: dict):
+        self.parent = parent
+        self.name = layer["name"]
+        self.width = layer["width"]
+        self.height = layer["height"]
+        self.data = array('I', layer["data"])
+
+    def iter_data(self):
+        """
+        :return: x, y and gid of every tile, empty ones included
+        """
+        for index, gid in enumerate(self.data):
+            yield index % self.width, index // self.width, gid
+
+    def tiles(self):
+        """
+        :return: x, y and image of every non-empty tile
+        """
+        for x, y, gid in self.iter_data():
+            if gid:
+                yield x, y, self.parent.get_tile_image_by_gid(gid)
+
+    def __iter__(self):
+        return self.iter_data()
+
+
+class CompiledObjectGroup:
+    def __init__(self, parent: CompiledMap, layer: dict):
+        self.name = layer["name"]
+        self.objects = [CompiledObject(parent, obj)
+                        for obj in layer["objects"]]
+
+    def __iter__(self):
+        return iter(self.objects)
+
+
+class CompiledObject:
+    def __init__(self, parent: CompiledMap, obj: dict):
+        self.parent = parent
+        self.name = obj["name"]
+        self.type = obj["type"]
+        self.x, self.y = obj["x"], obj["y"]
+        self.width, self.height = obj["width"], obj["height"]
+        self.gid = obj["gid"]
+        self.properties = obj["properties"]
+
+    @property
+    def image(self):
+        if self.gid:
+            return self.parent.get_tile_image_by_gid(self.gid)
+        return None
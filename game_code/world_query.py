@@ -0,0 +1,47 @@
+# Copyright (c) 2025 Your Name
+# Licensed under the AGPLv3 License. See LICENSE file for details.
+#
+# This project is based on a tutorial (link: https://www.youtube.com/watch?v=T4IX36sP_0c).
+# You can redistribute and/or modify it under the terms of the AGPLv3.
+#
+# This software comes with no warranty. See the LICENSE file for more information.
+
+import pygame
+from game_code.spatial import IndexedGroup
+
+
+class WorldQuery:
+    """
+    Looks up the sprites of the active map by category ("trees", "water",
+    "slimes", "interactions"). Every category is an IndexedGroup,
+    so a lookup only visits the sprites near the point or rect instead of
+    the whole group. Results come in the order the sprites were added, like
+    iterating the group would.
+    """
+
+    def __init__(self):
+        # category -> IndexedGroup of the active map
+        self.groups = {}
+
+    def bind(self, **groups: IndexedGroup):
+        """
+        Points the categories at the groups of the map being activated
+        :return: None
+        """
+        self.groups = groups
+
+    def at_point(self, category: str, point) -> list:
+        """
+        :param category: e.g. "trees"
+        :param point: x and y in world coordinates
+        :return: sprites of the category containing the point
+        """
+        return self.groups[category].at_point_ordered(point)
+
+    def in_rect(self, category: str, rect: pygame.Rect) -> list:
+        """
+        :param category: e.g. "interactions"
+        :param rect: area in world coordinates
+        :return: sprites of the category overlapping the area
+        """
+        return self.groups[category].in_rect_ordered(rect)
@@ -29,6 +29,7 @@ class Game:
 
                 for event in pygame.event.get():
                     if event.type == pygame.QUIT:
+                        self.level.shutdown()
                         pygame.quit()
                         sys.exit()
 
@@ -42,13 +43,14 @@ class Game:
 
                 for event in pygame.event.get():
                     if event.type == pygame.QUIT:
+                        self.level.shutdown()
                         pygame.quit()
                         sys.exit()
                     keys = pygame.key.get_pressed()
                     if keys[pygame.K_x]:
-                        self.level.active_music.set_volume(0)
+                        self.level.music.set_volume(0)
                     if keys[pygame.K_c]:
-                        self.level.active_music.set_volume(0.3)
+                        self.level.music.set_volume(1)
 
                     if keys[pygame.K_o]:
                         self.level.soil_layer.save_soil_state()